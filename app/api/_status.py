@@ -0,0 +1,43 @@
+from datetime import datetime
+from functools import lru_cache
+from typing import Optional, Tuple
+
+
+@lru_cache(maxsize=2048)
+def parse_iso(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp (accepting a trailing Z); jobs often share publish times"""
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+def compute_job_status(
+    privacy: str,
+    publish_at_str: Optional[str],
+    job_publish_dt: Optional[datetime],
+    now: datetime
+) -> Tuple[str, bool]:
+    """
+    Derive a job's status from its YouTube privacy and publish time.
+    
+    Returns:
+        (status, is_scheduled_not_public)
+    """
+    if privacy == 'public':
+        return 'published', False
+    
+    if privacy in ('private', 'unlisted') and publish_at_str:
+        try:
+            scheduled_time = parse_iso(publish_at_str)
+        except ValueError:
+            return 'scheduled', True
+        if scheduled_time <= now:
+            # Time has passed but still private - might be processing
+            return 'published', False
+        return 'scheduled', True
+    
+    if privacy in ('private', 'unlisted') and job_publish_dt:
+        # Private but no publishAt on YouTube - fall back to our own scheduled time
+        if job_publish_dt > now:
+            return 'scheduled', True
+        return 'uploaded', False
+    
+    return 'uploaded', False
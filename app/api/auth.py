@@ -1,6 +1,6 @@
 from fastapi import APIRouter, HTTPException, status, Depends
 from app.models.user import UserCreate, UserLogin
-from app.auth.password import hash_password, verify_password
+from app.auth.password import hash_password_async, verify_password_async
 from app.auth.jwt_handler import create_access_token
 from app.auth.dependencies import get_current_user
 from app.storage.storage_manager import storage_manager
@@ -23,13 +23,14 @@ async def signup(user_data: UserCreate):
     
     # Create user
     user_id = str(uuid.uuid4())
-    password_hash = hash_password(user_data.password)
+    password_hash = await hash_password_async(user_data.password)
     
+    now_iso = datetime.now(timezone.utc).isoformat()
     user = {
         "email": user_data.email,
         "password_hash": password_hash,
-        "created_at": datetime.now(timezone.utc).isoformat(),
-        "updated_at": datetime.now(timezone.utc).isoformat()
+        "created_at": now_iso,
+        "updated_at": now_iso
     }
     
     storage_manager.save_user(user_id, user)
@@ -57,7 +58,7 @@ async def login(credentials: UserLogin):
             detail="Invalid email or password"
         )
     
-    if not verify_password(credentials.password, user["password_hash"]):
+    if not await verify_password_async(credentials.password, user["password_hash"]):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password"
@@ -1,16 +1,308 @@
 from fastapi import APIRouter, HTTPException, status, Depends, UploadFile, File, Query
+from cachetools import TTLCache
 from app.models.video import VideoScheduleRequest, VideoScheduleResponse
 from app.json_handler.validator import JSONValidator
-from app.youtube.client import YouTubeClient
-from app.drive.downloader import DriveDownloader
+from app.youtube.client import YouTubeClient, get_or_create_client
+from app.drive.downloader import get_or_create_downloader
 from app.scheduler.job_manager import job_manager
 from app.auth.dependencies import get_current_user
 from app.storage.storage_manager import storage_manager
-from datetime import datetime, timezone
-import json
+from app.config.settings import settings
+from app.api._status import compute_job_status, parse_iso
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import asyncio
+import logging
+import operator
+import orjson
+import random
+import secrets
+import threading
+import traceback
 import uuid
 
 router = APIRouter(prefix="/api/videos", tags=["videos"])
+logger = logging.getLogger(__name__)
+
+# Content types accepted for schedule uploads (besides a .json filename)
+JSON_CONTENT_TYPES = ('application/json', 'text/json')
+# Max videos downloaded/uploaded at the same time for one schedule request
+UPLOAD_CONCURRENCY = 4
+# Upper bound (seconds) of the random delay before each YouTube upload
+UPLOAD_JITTER_SECONDS = 0.3
+# Max channels queried in parallel when listing scheduled videos
+CHANNEL_FETCH_CONCURRENCY = 5
+# Jobs due longer ago than this are no longer checked against YouTube in /jobs
+STALE_JOB_AGE = timedelta(hours=24)
+
+# Sort key for jobs without a parseable publish time (they list first)
+_EARLIEST = datetime.min.replace(tzinfo=timezone.utc)
+
+# Short-lived cache of /jobs responses keyed by (user_id, channel_id); UIs poll it.
+# Entries hold the user's job directory signature, so a job written by any
+# server worker invalidates them; YouTube-side changes show up after the TTL.
+_jobs_cache = TTLCache(maxsize=1024, ttl=settings.jobs_cache_ttl) if settings.jobs_cache_ttl > 0 else None
+_jobs_cache_lock = threading.Lock()
+
+
+def _invalidate_jobs_cache(user_id: str):
+    """Drop cached /jobs responses for a user"""
+    if _jobs_cache is None:
+        return
+    with _jobs_cache_lock:
+        for key in [key for key in _jobs_cache.keys() if key[0] == user_id]:
+            _jobs_cache.pop(key, None)
+
+
+class _ChannelClients:
+    """
+    YouTube access for one request.
+    
+    The first error from a channel (bad token, revoked access, ...) is
+    remembered and re-raised by later calls for that channel in the same
+    request, so a broken channel is not retried for every lookup.
+    """
+    
+    def __init__(self, user_id: str, errors: Optional[Dict[str, Exception]] = None):
+        self.user_id = user_id
+        self.errors: Dict[str, Exception] = dict(errors or {})
+    
+    def call(self, channel_id: str, method: Callable[[YouTubeClient], Any]) -> Any:
+        """Run method with the channel's client, or re-raise the channel's earlier error"""
+        error = self.errors.get(channel_id)
+        if error is not None:
+            raise error
+        try:
+            return method(get_or_create_client(self.user_id, channel_id))
+        except Exception as e:
+            self.errors.setdefault(channel_id, e)
+            raise
+
+
+def _fetch_video_statuses(
+    clients: _ChannelClients,
+    jobs: List[dict]
+) -> Tuple[Dict[str, dict], Dict[str, Exception]]:
+    """
+    Look up the YouTube status of every job's video, batched per channel.
+    
+    Returns:
+        (statuses by video_id, lookup errors by channel_id)
+    """
+    video_ids_by_channel = {}
+    for job in jobs:
+        if job.get('video_id') and job.get('channel_id'):
+            video_ids_by_channel.setdefault(job['channel_id'], []).append(job['video_id'])
+    
+    video_statuses = {}
+    status_errors = {}
+    for ch_id, video_ids in video_ids_by_channel.items():
+        try:
+            video_statuses.update(clients.call(ch_id, lambda client: client.get_videos_status(video_ids)))
+        except Exception as e:
+            status_errors[ch_id] = e
+    return video_statuses, status_errors
+
+
+def _job_publish_time(job: dict) -> Optional[datetime]:
+    """Parse a job's own publish_datetime (naive values are UTC), or None if missing/invalid"""
+    try:
+        if job.get('publish_datetime'):
+            publish_time = parse_iso(job['publish_datetime'])
+            if publish_time.tzinfo is None:
+                publish_time = publish_time.replace(tzinfo=timezone.utc)
+            return publish_time
+    except (AttributeError, TypeError, ValueError):
+        pass
+    return None
+
+
+def _may_be_upcoming(job: dict, publish_time: Optional[datetime], stale_before: datetime) -> bool:
+    """False for jobs that are already published or were due before stale_before"""
+    if job.get('status') == 'published':
+        return False
+    return publish_time is None or publish_time > stale_before
+
+
+class _ThumbnailCache:
+    """Per-request thumbnail downloads, shared by videos with the same URL or file content"""
+    
+    def __init__(self, user_id: str, channel_id: str):
+        self.user_id = user_id
+        self.channel_id = channel_id
+        self._by_url: Dict[str, asyncio.Future] = {}
+        self._by_checksum: Dict[str, asyncio.Future] = {}
+        self._paths: List[str] = []
+    
+    def get(self, url: str) -> asyncio.Future:
+        """Awaitable local path of the thumbnail at url, downloaded at most once"""
+        if url not in self._by_url:
+            self._by_url[url] = asyncio.ensure_future(self._fetch(url))
+        return self._by_url[url]
+    
+    async def _fetch(self, url: str) -> str:
+        try:
+            checksum = await asyncio.to_thread(
+                get_or_create_downloader(self.user_id, self.channel_id).get_file_checksum, url
+            )
+        except Exception as e:
+            logger.debug("Thumbnail checksum lookup failed for %s: %s", url, e)
+            checksum = None
+        
+        if not checksum:
+            return await self._download(url)
+        if checksum not in self._by_checksum:
+            self._by_checksum[checksum] = asyncio.ensure_future(self._download(url))
+        return await self._by_checksum[checksum]
+    
+    async def _download(self, url: str) -> str:
+        drive_downloader = get_or_create_downloader(self.user_id, self.channel_id)
+        path = await asyncio.to_thread(
+            drive_downloader.download_file,
+            url,
+            filename=f"{secrets.token_hex(16)}_thumbnail.jpg"
+        )
+        self._paths.append(path)
+        return path
+    
+    def cleanup(self):
+        """Delete every downloaded thumbnail"""
+        if not self._paths:
+            return
+        drive_downloader = get_or_create_downloader(self.user_id, self.channel_id)
+        for path in self._paths:
+            drive_downloader.cleanup_file(path)
+        self._paths.clear()
+
+
+async def _schedule_one_video(
+    user_id: str,
+    channel_id: str,
+    video,
+    thumbnails: _ThumbnailCache
+) -> dict:
+    """Download a single video from Drive, upload it to YouTube and record the job"""
+    job_id = str(uuid.uuid4())
+    
+    # Shared clients; each worker thread uses its own Google API service object
+    drive_downloader = get_or_create_downloader(user_id, channel_id)
+    youtube_client = get_or_create_client(user_id, channel_id)
+    
+    try:
+        # Open the video on Drive; it is streamed straight into the YouTube upload
+        video_media = await asyncio.to_thread(drive_downloader.stream_file, video.video_drive_url)
+        
+        # Download thumbnail if provided (shared with other videos using the same one)
+        thumbnail_path = None
+        if video.thumbnail_drive_url and video.thumbnail_drive_url.strip():
+            try:
+                thumbnail_path = await thumbnails.get(video.thumbnail_drive_url.strip())
+            except Exception as e:
+                # Thumbnail download failure is not critical
+                logger.warning("Thumbnail download failed: %s", e)
+                thumbnail_path = None
+        
+        # Parse publish datetime first (handle timezone-aware strings)
+        publish_datetime = parse_iso(video.publish_datetime)
+        
+        # Ensure datetime is timezone-aware (convert to UTC if needed)
+        if publish_datetime.tzinfo is None:
+            # If naive, assume it's already UTC
+            publish_datetime = publish_datetime.replace(tzinfo=timezone.utc)
+        else:
+            # Convert to UTC
+            publish_datetime = publish_datetime.astimezone(timezone.utc)
+        
+        # Small random delay so concurrent uploads don't hit YouTube in lockstep
+        await asyncio.sleep(random.uniform(0, UPLOAD_JITTER_SECONDS))
+        
+        # Upload to YouTube as Private WITH SCHEDULING (publishAt in status object)
+        upload_result = await asyncio.to_thread(
+            youtube_client.upload_video,
+            video_media=video_media,
+            title=video.title,
+            description=video.description,
+            tags=video.tags,
+            category_id=video.category_id,
+            made_for_kids=video.made_for_kids,
+            privacy_status="private",
+            publish_at=publish_datetime  # Set publishAt during upload
+        )
+        
+        video_id = upload_result["video_id"]
+        
+        # Upload thumbnail if available
+        if thumbnail_path:
+            try:
+                await asyncio.to_thread(youtube_client.upload_thumbnail, video_id, thumbnail_path)
+            except Exception as e:
+                # Thumbnail upload failure is not critical
+                logger.warning("Thumbnail upload failed: %s", e)
+        
+        # Create job record
+        job_data = {
+            "job_id": job_id,
+            "user_id": user_id,
+            "channel_id": channel_id,
+            "video_id": video_id,
+            "video_title": video.title,
+            "status": "scheduled",  # Already scheduled during upload
+            "publish_datetime": publish_datetime.isoformat(),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "error_message": None,
+            "metadata": {
+                "description": video.description,
+                "tags": video.tags,
+                "category_id": video.category_id
+            }
+        }
+        await asyncio.to_thread(storage_manager.save_job, job_id, job_data)
+        
+        # Also add to APScheduler as backup (in case YouTube scheduling fails);
+        # this writes the job to the SQLite jobstore
+        await asyncio.to_thread(
+            job_manager.schedule_publish,
+            user_id,
+            channel_id,
+            video_id,
+            publish_datetime,
+            job_id
+        )
+        
+        return {
+            "job_id": job_id,
+            "video_id": video_id,
+            "title": video.title,
+            "publish_datetime": video.publish_datetime
+        }
+        
+    except Exception as e:
+        error_message = str(e)
+        
+        # Save to failed videos storage
+        try:
+            failed_video_data = {
+                'title': video.title,
+                'attempted_schedule_time': video.publish_datetime,
+                'failure_time': datetime.now(timezone.utc).isoformat(),
+                'failure_reason': error_message,
+                'job_id': job_id,
+                'video_id': None
+            }
+            await asyncio.to_thread(
+                storage_manager.save_failed_video,
+                user_id,
+                channel_id,
+                failed_video_data,
+                max_entries=20
+            )
+        except Exception as save_error:
+            logger.error("Failed to save failed video to storage: %s", save_error)
+        
+        return {
+            "title": video.title,
+            "error": error_message
+        }
 
 
 @router.post("/schedule")
@@ -21,18 +313,31 @@ async def schedule_videos(
 ):
     """Upload JSON file and schedule videos"""
     
-    # Validate file type
-    if not file.filename.endswith('.json'):
+    # Validate file type and size before reading the upload
+    filename = (file.filename or '').lower()
+    if file.content_type not in JSON_CONTENT_TYPES and not filename.endswith('.json'):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="File must be a JSON file"
         )
     
-    # Read and parse JSON
-    content = await file.read()
+    max_bytes = settings.max_schedule_file_bytes
+    if file.size is not None and file.size > max_bytes:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"JSON file must be at most {max_bytes} bytes"
+        )
+    
+    # Read and parse JSON (read one byte past the limit in case size was unknown)
+    content = await file.read(max_bytes + 1)
+    if len(content) > max_bytes:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"JSON file must be at most {max_bytes} bytes"
+        )
     try:
-        data = json.loads(content)
-    except json.JSONDecodeError:
+        data = orjson.loads(content)
+    except orjson.JSONDecodeError:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid JSON format"
@@ -44,8 +349,7 @@ async def schedule_videos(
     if not is_valid:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="No valid videos found in JSON",
-            errors=errors
+            detail={"message": "No valid videos found in JSON", "errors": errors}
         )
     
     # Verify channel access
@@ -56,141 +360,36 @@ async def schedule_videos(
             detail="Channel not found or not authorized"
         )
     
-    # Process videos
-    success_list = []
-    failed_list = []
+    # Process videos concurrently, bounded so Drive/YouTube are not flooded
+    semaphore = asyncio.Semaphore(UPLOAD_CONCURRENCY)
+    thumbnails = _ThumbnailCache(current_user["id"], channel_id)
     
-    drive_downloader = DriveDownloader(current_user["id"], channel_id)
-    youtube_client = YouTubeClient(current_user["id"], channel_id)
+    async def _process_one(video):
+        async with semaphore:
+            return await _schedule_one_video(current_user["id"], channel_id, video, thumbnails)
     
-    for video in valid_videos:
-        job_id = str(uuid.uuid4())
-        video_path = None
-        thumbnail_path = None
-        
-        try:
-            # Download video from Drive
-            video_path = drive_downloader.download_file(
-                video.video_drive_url,
-                filename=f"{job_id}_video.mp4"
-            )
-            
-            # Download thumbnail if provided
-            thumbnail_path = None
-            if video.thumbnail_drive_url and video.thumbnail_drive_url.strip():
-                try:
-                    thumbnail_path = drive_downloader.download_file(
-                        video.thumbnail_drive_url,
-                        filename=f"{job_id}_thumbnail.jpg"
-                    )
-                except Exception as e:
-                    # Thumbnail download failure is not critical
-                    print(f"Thumbnail download failed: {e}")
-                    thumbnail_path = None
-            
-            # Parse publish datetime first (handle timezone-aware strings)
-            publish_datetime_str = video.publish_datetime
-            if publish_datetime_str.endswith('Z'):
-                publish_datetime_str = publish_datetime_str.replace('Z', '+00:00')
-            publish_datetime = datetime.fromisoformat(publish_datetime_str)
-            
-            # Ensure datetime is timezone-aware (convert to UTC if needed)
-            if publish_datetime.tzinfo is None:
-                # If naive, assume it's already UTC
-                publish_datetime = publish_datetime.replace(tzinfo=timezone.utc)
-            else:
-                # Convert to UTC
-                publish_datetime = publish_datetime.astimezone(timezone.utc)
-            
-            # Upload to YouTube as Private WITH SCHEDULING (publishAt in status object)
-            upload_result = youtube_client.upload_video(
-                video_path=video_path,
-                title=video.title,
-                description=video.description,
-                tags=video.tags,
-                category_id=video.category_id,
-                made_for_kids=video.made_for_kids,
-                privacy_status="private",
-                publish_at=publish_datetime  # Set publishAt during upload
-            )
-            
-            video_id = upload_result["video_id"]
-            
-            # Upload thumbnail if available
-            if thumbnail_path:
-                try:
-                    youtube_client.upload_thumbnail(video_id, thumbnail_path)
-                except Exception as e:
-                    # Thumbnail upload failure is not critical
-                    print(f"Thumbnail upload failed: {e}")
-            
-            # Create job record
-            job_data = {
-                "job_id": job_id,
-                "user_id": current_user["id"],
-                "channel_id": channel_id,
-                "video_id": video_id,
-                "video_title": video.title,
-                "status": "scheduled",  # Already scheduled during upload
-                "publish_datetime": publish_datetime.isoformat(),
-                "created_at": datetime.now(timezone.utc).isoformat(),
-                "error_message": None,
-                "metadata": {
-                    "description": video.description,
-                    "tags": video.tags,
-                    "category_id": video.category_id
-                }
-            }
-            storage_manager.save_job(job_id, job_data)
-            
-            # Also add to APScheduler as backup (in case YouTube scheduling fails)
-            job_manager.schedule_publish(
-                current_user["id"],
-                channel_id,
-                video_id,
-                publish_datetime,
-                job_id
-            )
-            
-            success_list.append({
-                "job_id": job_id,
-                "video_id": video_id,
-                "title": video.title,
-                "publish_datetime": video.publish_datetime
-            })
-            
-        except Exception as e:
-            error_message = str(e)
+    try:
+        results = await asyncio.gather(
+            *[_process_one(video) for video in valid_videos],
+            return_exceptions=True
+        )
+    finally:
+        thumbnails.cleanup()
+    
+    success_list = []
+    failed_list = []
+    for video, result in zip(valid_videos, results):
+        if isinstance(result, BaseException):
             failed_list.append({
                 "title": video.title,
-                "error": error_message
+                "error": str(result)
             })
-            
-            # Save to failed videos storage
-            try:
-                failed_video_data = {
-                    'title': video.title,
-                    'attempted_schedule_time': video.publish_datetime,
-                    'failure_time': datetime.now(timezone.utc).isoformat(),
-                    'failure_reason': error_message,
-                    'job_id': job_id,
-                    'video_id': None
-                }
-                storage_manager.save_failed_video(
-                    current_user["id"],
-                    channel_id,
-                    failed_video_data,
-                    max_entries=20
-                )
-            except Exception as save_error:
-                print(f"Failed to save failed video to storage: {save_error}")
-        
-        finally:
-            # Cleanup temporary files
-            if video_path:
-                drive_downloader.cleanup_file(video_path)
-            if thumbnail_path:
-                drive_downloader.cleanup_file(thumbnail_path)
+        elif result.get("error"):
+            failed_list.append(result)
+        else:
+            success_list.append(result)
+    
+    _invalidate_jobs_cache(current_user["id"])
     
     return VideoScheduleResponse(
         success=success_list,
@@ -204,7 +403,16 @@ async def schedule_videos(
 @router.get("/jobs")
 async def get_jobs(current_user: dict = Depends(get_current_user), channel_id: str = Query(None)):
     """Get all scheduled jobs for current user - shows videos that are scheduled and not yet public"""
+    cache_key = (current_user["id"], channel_id)
+    jobs_signature = storage_manager.get_user_jobs_signature(current_user["id"])
+    if _jobs_cache is not None:
+        with _jobs_cache_lock:
+            cached = _jobs_cache.get(cache_key)
+        if cached is not None and cached[0] == jobs_signature:
+            return cached[1]
+    
     jobs = storage_manager.get_user_jobs(current_user["id"])
+    clients = _ChannelClients(current_user["id"])
     
     # Fetch scheduled videos directly from YouTube
     youtube_scheduled_videos = {}
@@ -214,33 +422,62 @@ async def get_jobs(current_user: dict = Depends(get_current_user), channel_id: s
     if channel_id:
         channels_to_check = [channel_id]
     else:
-        # Get all connected channels for this user
-        from app.api.youtube import get_channels
+        # Get all connected channels for this user; channels that already
+        # failed here are not retried by the status lookups below
+        from app.api.youtube import resolve_channels
         try:
-            channels_response = await get_channels(current_user)
-            channels_to_check = [ch['id'] for ch in channels_response.get('channels', [])]
+            channels, channel_errors = await resolve_channels(current_user["id"])
+            channels_to_check = [ch['id'] for ch in channels]
+            clients.errors.update(channel_errors)
         except Exception as e:
-            print(f"Error getting channels: {e}")
+            logger.warning("Error getting channels: %s", e)
     
-    # Fetch scheduled videos from each channel
-    for ch_id in channels_to_check:
-        try:
-            print(f"Fetching scheduled videos for channel: {ch_id}")
-            youtube_client = YouTubeClient(current_user["id"], ch_id)
-            scheduled_videos = youtube_client.get_scheduled_videos()
-            print(f"Found {len(scheduled_videos)} scheduled videos from channel {ch_id}")
-            for video in scheduled_videos:
-                youtube_scheduled_videos[video['video_id']] = video
-        except Exception as e:
-            import traceback
-            print(f"Error fetching scheduled videos from YouTube channel {ch_id}: {e}")
-            print(traceback.format_exc())
+    # Fetch scheduled videos from all channels concurrently
+    semaphore = asyncio.Semaphore(CHANNEL_FETCH_CONCURRENCY)
+    
+    async def _fetch_scheduled(ch_id):
+        async with semaphore:
+            logger.debug("Fetching scheduled videos for channel: %s", ch_id)
+            return await asyncio.to_thread(clients.call, ch_id, YouTubeClient.get_scheduled_videos)
+    
+    results = await asyncio.gather(
+        *[_fetch_scheduled(ch_id) for ch_id in channels_to_check],
+        return_exceptions=True
+    )
+    
+    for ch_id, scheduled_videos in zip(channels_to_check, results):
+        if isinstance(scheduled_videos, Exception):
+            logger.warning("Error fetching scheduled videos from YouTube channel %s: %s", ch_id, scheduled_videos)
+            logger.debug("Scheduled video fetch failed for channel %s", ch_id, exc_info=scheduled_videos)
+            continue
+        logger.debug("Found %d scheduled videos from channel %s", len(scheduled_videos), ch_id)
+        for video in scheduled_videos:
+            youtube_scheduled_videos[video['video_id']] = video
+    
+    current_time = datetime.now(timezone.utc)
+    current_time_iso = current_time.isoformat()
+    
+    # Published jobs, and jobs whose publish time is long past, can never be
+    # listed as upcoming again - don't spend YouTube quota on them
+    # Each job's publish time is parsed once here and reused by the checks below
+    stale_before = current_time - STALE_JOB_AGE
+    publish_times = [_job_publish_time(job) for job in jobs]
+    candidates = [
+        (job, publish_time)
+        for job, publish_time in zip(jobs, publish_times)
+        if _may_be_upcoming(job, publish_time, stale_before)
+    ]
+    candidate_jobs = [job for job, _ in candidates]
+    
+    # Fetch YouTube status for all jobs with one batched lookup per channel
+    video_statuses, status_errors = await asyncio.to_thread(_fetch_video_statuses, clients, candidate_jobs)
     
     # Sync status with YouTube for each job and filter
+    # (publish time, job) pairs, sorted once everything is collected
     synced_jobs = []
-    current_time = datetime.now(timezone.utc)
+    synced_video_ids = set()
     
-    for job in jobs:
+    for job, job_publish_time in candidates:
         is_scheduled_and_not_public = False
         
         # Extract video_description from metadata if available
@@ -251,8 +488,9 @@ async def get_jobs(current_user: dict = Depends(get_current_user), channel_id: s
         
         if job.get('video_id') and job.get('channel_id'):
             try:
-                youtube_client = YouTubeClient(current_user["id"], job['channel_id'])
-                video_status = youtube_client.get_video_status(job['video_id'])
+                if job['channel_id'] in status_errors:
+                    raise status_errors[job['channel_id']]
+                video_status = video_statuses.get(job['video_id'])
                 
                 if video_status:
                     # Update job status based on YouTube status
@@ -264,94 +502,45 @@ async def get_jobs(current_user: dict = Depends(get_current_user), channel_id: s
                         job['video_description'] = video_status.get('description', '')
                     
                     # Determine status based on YouTube privacy and publish time
-                    if youtube_privacy == 'public':
-                        job['status'] = 'published'
-                        # Skip public videos - don't include in scheduled jobs list
-                        is_scheduled_and_not_public = False
-                    elif youtube_privacy in ['private', 'unlisted'] and publish_at:
-                        # Check if scheduled time has passed
-                        try:
-                            scheduled_time = datetime.fromisoformat(publish_at.replace('Z', '+00:00'))
-                            if scheduled_time <= current_time:
-                                # Time has passed but still private - might be processing
-                                job['status'] = 'published'
-                                is_scheduled_and_not_public = False
-                            else:
-                                # Still scheduled for future
-                                job['status'] = 'scheduled'
-                                is_scheduled_and_not_public = True
-                        except:
-                            job['status'] = 'scheduled'
-                            is_scheduled_and_not_public = True
-                    elif youtube_privacy in ['private', 'unlisted']:
-                        # Private but no publish_at - check if we have a scheduled time in job
-                        job_publish_time = None
-                        try:
-                            if job.get('publish_datetime'):
-                                job_publish_time = datetime.fromisoformat(
-                                    job['publish_datetime'].replace('Z', '+00:00')
-                                )
-                                if job_publish_time > current_time:
-                                    job['status'] = 'scheduled'
-                                    is_scheduled_and_not_public = True
-                                else:
-                                    job['status'] = 'uploaded'
-                                    is_scheduled_and_not_public = False
-                            else:
-                                job['status'] = 'uploaded'
-                                is_scheduled_and_not_public = False
-                        except:
-                            job['status'] = 'uploaded'
-                            is_scheduled_and_not_public = False
-                    else:
-                        job['status'] = 'uploaded'
-                        is_scheduled_and_not_public = False
+                    job['status'], is_scheduled_and_not_public = compute_job_status(
+                        youtube_privacy,
+                        publish_at,
+                        job_publish_time,
+                        current_time
+                    )
                     
                     # Update metadata
                     job['youtube_privacy'] = youtube_privacy
                     job['youtube_publish_at'] = publish_at
             except Exception as e:
                 # If we can't sync, check job's own publish_datetime
-                print(f"Error syncing job {job.get('job_id')}: {e}")
-                try:
-                    if job.get('publish_datetime'):
-                        job_publish_time = datetime.fromisoformat(
-                            job['publish_datetime'].replace('Z', '+00:00')
-                        )
-                        if job_publish_time > current_time and job.get('status') in ['scheduled', 'uploaded']:
-                            is_scheduled_and_not_public = True
-                            job['status'] = 'scheduled'
-                except:
-                    pass
+                logger.warning("Error syncing job %s: %s", job.get('job_id'), e)
+                if job_publish_time and job_publish_time > current_time and job.get('status') in ['scheduled', 'uploaded']:
+                    is_scheduled_and_not_public = True
+                    job['status'] = 'scheduled'
         else:
             # No video_id yet - check if it's scheduled for future
-            try:
-                if job.get('publish_datetime'):
-                    job_publish_time = datetime.fromisoformat(
-                        job['publish_datetime'].replace('Z', '+00:00')
-                    )
-                    if job_publish_time > current_time and job.get('status') in ['scheduled', 'uploaded', 'pending']:
-                        is_scheduled_and_not_public = True
-            except:
-                pass
+            if job_publish_time and job_publish_time > current_time and job.get('status') in ['scheduled', 'uploaded', 'pending']:
+                is_scheduled_and_not_public = True
         
         # Only include jobs that are scheduled and not yet public
         if is_scheduled_and_not_public:
-            synced_jobs.append(job)
-            # Remove from YouTube scheduled videos if it's already in our DB
-            if job.get('video_id') in youtube_scheduled_videos:
-                del youtube_scheduled_videos[job.get('video_id')]
+            synced_jobs.append((job_publish_time or _EARLIEST, job))
+            if job.get('video_id'):
+                synced_video_ids.add(job['video_id'])
     
     # Add videos from YouTube that aren't in our database
-    print(f"Processing {len(youtube_scheduled_videos)} videos from YouTube")
-    for video_id, video_data in youtube_scheduled_videos.items():
+    extra_video_ids = [video_id for video_id in youtube_scheduled_videos if video_id not in synced_video_ids]
+    logger.debug("Processing %d videos from YouTube", len(extra_video_ids))
+    for video_id in extra_video_ids:
+        video_data = youtube_scheduled_videos[video_id]
         try:
             publish_at = video_data.get('publish_at')
             if publish_at:
-                scheduled_time = datetime.fromisoformat(publish_at.replace('Z', '+00:00'))
+                scheduled_time = parse_iso(publish_at)
                 if scheduled_time > current_time:
                     # This is a scheduled video not in our DB - add it
-                    synced_jobs.append({
+                    synced_jobs.append((scheduled_time, {
                         'job_id': f"youtube_{video_id}",
                         'video_id': video_id,
                         'video_title': video_data['title'],
@@ -362,29 +551,36 @@ async def get_jobs(current_user: dict = Depends(get_current_user), channel_id: s
                         'user_id': current_user["id"],
                         'youtube_privacy': video_data['privacy_status'],
                         'youtube_publish_at': publish_at,
-                        'created_at': datetime.now(timezone.utc).isoformat(),
+                        'created_at': current_time_iso,
                         'from_youtube': True  # Flag to indicate this came from YouTube
-                    })
-                    print(f"Added scheduled video: {video_data['title']} (publish: {publish_at})")
+                    }))
+                    logger.debug("Added scheduled video: %s (publish: %s)", video_data['title'], publish_at)
         except Exception as e:
-            import traceback
-            print(f"Error processing YouTube video {video_id}: {e}")
-            print(traceback.format_exc())
+            logger.warning("Error processing YouTube video %s: %s", video_id, e)
+            logger.debug("Processing failed for YouTube video %s", video_id, exc_info=True)
     
     # Sort by publish_datetime (earliest first - so upcoming videos appear first)
-    synced_jobs.sort(key=lambda x: x.get('publish_datetime', ''))
+    synced_jobs.sort(key=operator.itemgetter(0))
+    
+    logger.debug(
+        "Returning %d scheduled jobs (from DB: %d, from YouTube: %d)",
+        len(synced_jobs), len(jobs), len(extra_video_ids)
+    )
     
-    print(f"Returning {len(synced_jobs)} scheduled jobs (from DB: {len(jobs)}, from YouTube: {len(youtube_scheduled_videos)})")
+    response = {"jobs": [job for _, job in synced_jobs]}
+    if _jobs_cache is not None:
+        with _jobs_cache_lock:
+            _jobs_cache[cache_key] = (jobs_signature, response)
     
-    return {"jobs": synced_jobs}
+    return response
 
 
 @router.get("/jobs/debug")
 async def debug_scheduled_videos(current_user: dict = Depends(get_current_user), channel_id: str = Query(...)):
     """Debug endpoint to test YouTube scheduled videos fetching"""
     try:
-        youtube_client = YouTubeClient(current_user["id"], channel_id)
-        scheduled_videos = youtube_client.get_scheduled_videos()
+        youtube_client = get_or_create_client(current_user["id"], channel_id)
+        scheduled_videos = await asyncio.to_thread(youtube_client.get_scheduled_videos)
         
         return {
             "channel_id": channel_id,
@@ -392,7 +588,6 @@ async def debug_scheduled_videos(current_user: dict = Depends(get_current_user),
             "scheduled_videos": scheduled_videos
         }
     except Exception as e:
-        import traceback
         return {
             "error": str(e),
             "traceback": traceback.format_exc()
@@ -419,32 +614,25 @@ async def get_job_status(job_id: str, current_user: dict = Depends(get_current_u
     # Sync with YouTube if video_id exists
     if job.get('video_id') and job.get('channel_id'):
         try:
-            youtube_client = YouTubeClient(current_user["id"], job['channel_id'])
-            video_status = youtube_client.get_video_status(job['video_id'])
+            youtube_client = get_or_create_client(current_user["id"], job['channel_id'])
+            video_status = await asyncio.to_thread(youtube_client.get_video_status, job['video_id'])
             
             if video_status:
                 youtube_privacy = video_status['privacy_status']
                 publish_at = video_status.get('publish_at')
                 
                 # Update status based on YouTube
-                if youtube_privacy == 'public':
-                    job['status'] = 'published'
-                elif youtube_privacy == 'private' and publish_at:
-                    try:
-                        scheduled_time = datetime.fromisoformat(publish_at.replace('Z', '+00:00'))
-                        if scheduled_time <= datetime.now(timezone.utc):
-                            job['status'] = 'published'
-                        else:
-                            job['status'] = 'scheduled'
-                    except:
-                        job['status'] = 'scheduled'
-                else:
-                    job['status'] = 'uploaded'
+                job['status'], _ = compute_job_status(
+                    youtube_privacy,
+                    publish_at,
+                    _job_publish_time(job),
+                    datetime.now(timezone.utc)
+                )
                 
                 job['youtube_privacy'] = youtube_privacy
                 job['youtube_publish_at'] = publish_at
         except Exception as e:
-            print(f"Error syncing job {job_id}: {e}")
+            logger.warning("Error syncing job %s: %s", job_id, e)
     
     # Get scheduler status
     job_status = job_manager.get_job_status(job_id)
@@ -457,37 +645,39 @@ async def sync_jobs_with_youtube(current_user: dict = Depends(get_current_user))
     """Sync all jobs with YouTube to get current status"""
     jobs = storage_manager.get_user_jobs(current_user["id"])
     
-    synced_count = 0
+    clients = _ChannelClients(current_user["id"])
+    video_statuses, status_errors = await asyncio.to_thread(_fetch_video_statuses, clients, jobs)
+    current_time = datetime.now(timezone.utc)
+    
+    updates = []
     for job in jobs:
         if job.get('video_id') and job.get('channel_id'):
             try:
-                youtube_client = YouTubeClient(current_user["id"], job['channel_id'])
-                video_status = youtube_client.get_video_status(job['video_id'])
+                if job['channel_id'] in status_errors:
+                    raise status_errors[job['channel_id']]
+                video_status = video_statuses.get(job['video_id'])
                 
                 if video_status:
                     youtube_privacy = video_status['privacy_status']
                     publish_at = video_status.get('publish_at')
                     
                     # Update status
-                    if youtube_privacy == 'public':
-                        new_status = 'published'
-                    elif youtube_privacy == 'private' and publish_at:
-                        try:
-                            scheduled_time = datetime.fromisoformat(publish_at.replace('Z', '+00:00'))
-                            if scheduled_time <= datetime.now(timezone.utc):
-                                new_status = 'published'
-                            else:
-                                new_status = 'scheduled'
-                        except:
-                            new_status = 'scheduled'
-                    else:
-                        new_status = 'uploaded'
+                    new_status, _ = compute_job_status(
+                        youtube_privacy,
+                        publish_at,
+                        _job_publish_time(job),
+                        current_time
+                    )
                     
                     if job.get('status') != new_status:
-                        storage_manager.update_job_status(job['job_id'], new_status, video_id=job['video_id'])
-                        synced_count += 1
+                        updates.append((job['job_id'], new_status, job['video_id']))
             except Exception as e:
-                print(f"Error syncing job {job.get('job_id')}: {e}")
+                logger.warning("Error syncing job %s: %s", job.get('job_id'), e)
+    
+    # Persist all changed statuses under one storage lock hold
+    storage_manager.bulk_update_job_status(current_user["id"], updates)
+    synced_count = len(updates)
+    _invalidate_jobs_cache(current_user["id"])
     
     return {
         "message": f"Synced {synced_count} jobs with YouTube",
@@ -544,8 +734,8 @@ async def refresh_recent_videos(
     
     try:
         # Fetch from YouTube
-        youtube_client = YouTubeClient(current_user["id"], channel_id)
-        recent_videos = youtube_client.get_recent_videos(max_results=20)
+        youtube_client = get_or_create_client(current_user["id"], channel_id)
+        recent_videos = await asyncio.to_thread(youtube_client.get_recent_videos, max_results=20)
         
         # Save to storage (auto-deletes older entries, keeps max 20)
         storage_manager.save_recent_videos(
@@ -642,7 +832,8 @@ async def refresh_failed_videos(
         
         # Save to storage (this will auto-limit to 20)
         for failed_video in failed_videos:
-            storage_manager.save_failed_video(
+            await asyncio.to_thread(
+                storage_manager.save_failed_video,
                 current_user["id"],
                 channel_id,
                 failed_video,
@@ -1,11 +1,15 @@
 from fastapi import APIRouter, HTTPException, status, Depends, Query
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import RedirectResponse
 from app.youtube.oauth import get_authorization_url, exchange_code_for_token
-from app.youtube.client import YouTubeClient
+from app.youtube.client import YouTubeClient, get_or_create_client
 from app.auth.dependencies import get_current_user
 from app.storage.storage_manager import storage_manager
 from datetime import datetime, timezone
-import uuid
+from typing import Any, Dict, List, Tuple
+from urllib.parse import urlencode
+import asyncio
+import secrets
 
 router = APIRouter(prefix="/api/youtube", tags=["youtube"])
 
@@ -41,10 +45,11 @@ async def oauth_callback(code: str = Query(...), state: str = Query(None)):
         # For now, we'll store and then fetch channel info
         
         # Store token temporarily to get channel info
-        temp_channel_id = str(uuid.uuid4())
+        temp_channel_id = secrets.token_hex(16)
+        now_iso = datetime.now(timezone.utc).isoformat()
         storage_manager.save_token(user_id, temp_channel_id, {
             **token_data,
-            "created_at": datetime.now(timezone.utc).isoformat()
+            "created_at": now_iso
         })
         
         # Get actual channel info
@@ -57,44 +62,57 @@ async def oauth_callback(code: str = Query(...), state: str = Query(None)):
             **token_data,
             "channel_id": actual_channel_id,
             "channel_name": channel_info["title"],
-            "created_at": datetime.now(timezone.utc).isoformat()
+            "created_at": now_iso
         })
         
         # Remove temp token
-        tokens = storage_manager.get_user_tokens(user_id)
-        if temp_channel_id in tokens:
-            del tokens[temp_channel_id]
-            storage_manager._write_json(
-                storage_manager.tokens_file,
-                {**storage_manager.get_tokens(), user_id: tokens}
-            )
+        storage_manager.delete_token(user_id, temp_channel_id)
         
         # Redirect to frontend with success
         return RedirectResponse(
-            url=f"/?oauth_success=true&channel={channel_info['title']}",
+            url="/?" + urlencode({"oauth_success": "true", "channel": channel_info["title"]}),
             status_code=302
         )
     except Exception as e:
         # Redirect to frontend with error
         return RedirectResponse(
-            url=f"/?oauth_error={str(e)}",
+            url="/?" + urlencode({"oauth_error": str(e)}),
             status_code=302
         )
 
 
-@router.get("/channels")
-async def get_channels(current_user: dict = Depends(get_current_user)):
-    """Get all connected YouTube channels for current user"""
-    tokens = storage_manager.get_user_tokens(current_user["id"])
+def _fetch_channel_info(user_id: str, channel_id: str) -> Dict[str, Any]:
+    """Blocking YouTube lookup of one connected channel"""
+    return get_or_create_client(user_id, channel_id).get_channel_info()
+
+
+async def resolve_channels(user_id: str) -> Tuple[List[Dict[str, Any]], Dict[str, Exception]]:
+    """
+    Look up every connected channel of a user, all channels at once.
+    
+    Returns:
+        (channel infos, errors by channel_id for channels that could not be read)
+    """
+    channel_ids = list(storage_manager.get_user_tokens(user_id))
+    results = await asyncio.gather(
+        *(run_in_threadpool(_fetch_channel_info, user_id, channel_id) for channel_id in channel_ids),
+        return_exceptions=True
+    )
     
     channels = []
-    for channel_id, token_data in tokens.items():
-        try:
-            client = YouTubeClient(current_user["id"], channel_id)
-            channel_info = client.get_channel_info()
-            channels.append(channel_info)
-        except Exception as e:
-            # Skip channels with invalid tokens
-            continue
+    errors = {}
+    for channel_id, result in zip(channel_ids, results):
+        if isinstance(result, Exception):
+            errors[channel_id] = result
+        else:
+            channels.append(result)
     
+    return channels, errors
+
+
+@router.get("/channels")
+async def get_channels(current_user: dict = Depends(get_current_user)):
+    """Get all connected YouTube channels for current user"""
+    # Channels with invalid tokens are skipped
+    channels, _ = await resolve_channels(current_user["id"])
     return {"channels": channels}
@@ -1,14 +1,27 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from app.auth.jwt_handler import decode_access_token
+from app.auth.token_cache import get_cached_user, cache_user
 from app.storage.storage_manager import storage_manager
+from typing import Optional
 
-security = HTTPBearer()
+security = HTTPBearer(auto_error=False)
 
 
-async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> dict:
+async def get_current_user(credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)) -> dict:
     """Get current authenticated user from JWT token"""
+    if credentials is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
     token = credentials.credentials
+    
+    cached_user = get_cached_user(token)
+    if cached_user is not None:
+        return cached_user
+    
     payload = decode_access_token(token)
     
     if payload is None:
@@ -32,4 +45,8 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
             detail="User not found",
         )
     
-    return {**user, "id": user_id}
+    current_user = {**user, "id": user_id}
+    if payload.get("exp"):
+        cache_user(token, current_user, payload["exp"])
+    
+    return current_user
@@ -1,9 +1,21 @@
+from fastapi.concurrency import run_in_threadpool
 from passlib.context import CryptContext
+from app.config.settings import settings
 import bcrypt
+import logging
+import time
+
+logger = logging.getLogger(__name__)
 
 # Use bcrypt directly to avoid passlib compatibility issues
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Calibration never goes below this cost (OWASP minimum for bcrypt)
+MIN_BCRYPT_ROUNDS = 10
+
+# Cost used for new hashes; existing hashes carry their own cost
+_bcrypt_rounds = settings.bcrypt_rounds
+
 
 def hash_password(password: str) -> str:
     """Hash a password"""
@@ -14,7 +26,7 @@ def hash_password(password: str) -> str:
     if len(password) > 72:
         password = password[:72]
     # Hash using bcrypt directly
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=_bcrypt_rounds)
     hashed = bcrypt.hashpw(password, salt)
     return hashed.decode('utf-8')
 
@@ -33,3 +45,42 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         return bcrypt.checkpw(plain_password, hashed_bytes)
     except Exception:
         return False
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password in the request threadpool so the event loop is not blocked"""
+    return await run_in_threadpool(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password in the request threadpool so the event loop is not blocked"""
+    return await run_in_threadpool(verify_password, plain_password, hashed_password)
+
+
+def calibrate_bcrypt_rounds(target_ms: int = None) -> int:
+    """
+    Pick the bcrypt cost for new hashes on this hardware.
+    
+    Starting from settings.bcrypt_rounds, the cost is lowered one step at a
+    time (each step halves the work) until a single hash takes at most
+    target_ms, but never below MIN_BCRYPT_ROUNDS. A target of 0 keeps the
+    configured cost.
+    """
+    global _bcrypt_rounds
+    if target_ms is None:
+        target_ms = settings.bcrypt_target_ms
+    if target_ms <= 0:
+        return _bcrypt_rounds
+    
+    rounds = settings.bcrypt_rounds
+    while rounds > MIN_BCRYPT_ROUNDS:
+        start = time.perf_counter()
+        bcrypt.hashpw(b"calibration", bcrypt.gensalt(rounds=rounds))
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if elapsed_ms <= target_ms:
+            break
+        rounds -= 1
+    
+    _bcrypt_rounds = rounds
+    logger.info("Using bcrypt cost %d for new password hashes", rounds)
+    return rounds
@@ -0,0 +1,38 @@
+from cachetools import TLRUCache
+from app.config.settings import settings
+from typing import Optional
+import hashlib
+import threading
+import time
+
+
+def _time_to_use(key: bytes, value: tuple, now: float) -> float:
+    """Entries expire with their JWT, or after auth_cache_ttl seconds if that is sooner"""
+    return min(value[1], now + settings.auth_cache_ttl)
+
+
+# Verified tokens (by digest) -> (user, token expiry timestamp)
+_token_cache = TLRUCache(maxsize=10_000, ttu=_time_to_use, timer=time.time)
+_token_cache_lock = threading.Lock()
+
+
+def _cache_key(token: str) -> bytes:
+    """Fixed-size cache key so raw tokens are not kept in memory"""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def get_cached_user(token: str) -> Optional[dict]:
+    """Get the user for a token verified within the cache window"""
+    if settings.auth_cache_ttl <= 0:
+        return None
+    with _token_cache_lock:
+        cached = _token_cache.get(_cache_key(token))
+    return cached[0] if cached is not None else None
+
+
+def cache_user(token: str, user: dict, expires_at: float):
+    """Remember the user for a verified token until expires_at (a Unix timestamp)"""
+    if settings.auth_cache_ttl <= 0 or expires_at <= time.time():
+        return
+    with _token_cache_lock:
+        _token_cache[_cache_key(token)] = (user, expires_at)
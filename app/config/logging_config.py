@@ -0,0 +1,32 @@
+import atexit
+import logging
+import logging.handlers
+import queue
+from app.config.settings import settings
+
+_listener = None
+
+
+def setup_logging():
+    """
+    Configure the "app" logger.
+    
+    Records are handed to a QueueHandler and written to stderr by a
+    QueueListener thread, so request handlers never block on log I/O.
+    """
+    global _listener
+    if _listener is not None:
+        return
+    
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s [%(name)s] %(message)s"))
+    
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+    
+    app_logger = logging.getLogger("app")
+    app_logger.setLevel(settings.log_level.upper())
+    app_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    app_logger.propagate = False
@@ -11,19 +11,41 @@ class Settings(BaseSettings):
     # JWT
     jwt_secret_key: str = "change-this-secret-key-in-production"
     jwt_algorithm: str = "HS256"
+    auth_cache_ttl: int = 0  # Seconds to cache verified tokens (0 disables)
+    
+    # Password hashing
+    bcrypt_rounds: int = 12
+    bcrypt_target_ms: int = 0  # Lower bcrypt_rounds at startup until a hash fits (0 disables)
     
     # Server
     host: str = "0.0.0.0"
     port: int = 8000
+    log_level: str = "INFO"
     
     # Storage paths
     storage_dir: str = "storage"
     users_file: str = "storage/users.json"
+    recent_videos_file: str = "storage/recent_videos.json"
+    jobs_dir: str = "storage/jobs"
+    tokens_dir: str = "storage/tokens"
+    failed_videos_dir: str = "storage/failed_videos"
+    
+    # Single-file storage from before sharding, migrated on startup
     tokens_file: str = "storage/youtube_tokens.json"
     jobs_file: str = "storage/scheduled_jobs.json"
-    recent_videos_file: str = "storage/recent_videos.json"
     failed_videos_file: str = "storage/failed_videos.json"
     
+    # Scheduled publish jobs (SQLite database). With several workers, jobs added
+    # by a worker that does not run the scheduler are picked up within 30s
+    scheduler_db_file: str = "storage/scheduler.db"
+    
+    # Uploads
+    max_schedule_file_bytes: int = 5 * 1024 * 1024
+    
+    # Seconds to cache GET /api/videos/jobs responses per user and channel (0 disables);
+    # job writes from any worker invalidate them, changes made on YouTube wait out the TTL
+    jobs_cache_ttl: int = 5
+    
     class Config:
         env_file = ".env"
         case_sensitive = False
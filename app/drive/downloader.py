@@ -1,12 +1,77 @@
 import os
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import MediaIoBaseDownload, MediaUpload
 from google.oauth2.credentials import Credentials
-from app.youtube.oauth import get_credentials_from_token, refresh_credentials
+from cachetools import TTLCache
+from app.youtube.oauth import get_cached_credentials
+from app.http.discovery import build_service
 from app.storage.storage_manager import storage_manager
-from typing import Optional
+from typing import Callable, Optional
 from pathlib import Path
+import re
 import tempfile
+import threading
+
+
+# Bytes fetched from Drive per request, for downloads and for ranged reads
+# when streaming into an upload (resumable uploads need a multiple of 256KB)
+STREAM_CHUNK_SIZE = 8 * 1024 * 1024
+
+# File ID from .../file/d/<id>/... or ...?id=<id>&... share links
+_DRIVE_ID_RE = re.compile(r'(?:/file/d/|[?&]id=)([^/&?#]+)')
+
+# Where downloaded files are kept until they are uploaded
+TEMP_DIR = Path(tempfile.gettempdir()) / "youtube_scheduler"
+
+
+def _ensure_temp_dir() -> Path:
+    """Create TEMP_DIR if missing; checked per download since tmp cleaners may remove it"""
+    TEMP_DIR.mkdir(exist_ok=True)
+    return TEMP_DIR
+
+
+class DriveMediaUpload(MediaUpload):
+    """
+    Resumable upload source backed by a Drive file.
+    
+    Each upload chunk is fetched with a ranged Drive request, so the file
+    flows Drive -> YouTube without being written to disk or held in memory
+    beyond one chunk. A failed chunk is simply re-read from Drive.
+    
+    get_service is called per chunk so the read uses the uploading thread's
+    own Drive service.
+    """
+    
+    def __init__(self, get_service: Callable, file_id: str, size: int, mimetype: str, chunksize: int = STREAM_CHUNK_SIZE):
+        super().__init__()
+        self._get_service = get_service
+        self._file_id = file_id
+        self._size = size
+        self._mimetype = mimetype
+        self._chunksize = chunksize
+    
+    def chunksize(self):
+        return self._chunksize
+    
+    def mimetype(self):
+        return self._mimetype
+    
+    def size(self):
+        return self._size
+    
+    def resumable(self):
+        return True
+    
+    def getbytes(self, begin, length):
+        length = min(length, self._size - begin)
+        if length <= 0:
+            return b''
+        request = self._get_service().files().get_media(fileId=self._file_id)
+        request.headers['range'] = f'bytes={begin}-{begin + length - 1}'
+        try:
+            return request.execute(num_retries=3)
+        except HttpError as e:
+            raise Exception(f"Drive download error: {e}")
 
 
 class DriveDownloader:
@@ -15,32 +80,33 @@ class DriveDownloader:
     def __init__(self, user_id: str, channel_id: str):
         self.user_id = user_id
         self.channel_id = channel_id
-        self._service = None
-        self.temp_dir = Path(tempfile.gettempdir()) / "youtube_scheduler"
-        self.temp_dir.mkdir(exist_ok=True)
+        # Stored token the credentials were built from
+        self.token_data = None
+        self._credentials = None
+        self._credentials_lock = threading.Lock()
+        # Service objects wrap a non-thread-safe httplib2.Http, so each thread builds its own
+        self._local = threading.local()
+        self.temp_dir = TEMP_DIR
+    
+    def _get_credentials(self) -> Credentials:
+        """Load the channel's credentials once per downloader"""
+        with self._credentials_lock:
+            if self._credentials is None:
+                self._credentials, self.token_data = get_cached_credentials(self.user_id, self.channel_id)
+            
+            return self._credentials
     
     def _get_service(self):
         """Get Drive service with valid credentials"""
-        if self._service is None:
-            token_data = storage_manager.get_token(self.user_id, self.channel_id)
-            if not token_data:
-                raise ValueError("No token found for this channel")
-            
-            credentials = get_credentials_from_token(token_data)
-            credentials = refresh_credentials(credentials)
-            self._service = build('drive', 'v3', credentials=credentials)
-        
-        return self._service
+        service = getattr(self._local, 'service', None)
+        if service is None:
+            service = self._local.service = build_service('drive', 'v3', self._get_credentials())
+        return service
     
     def _extract_file_id(self, url: str) -> Optional[str]:
         """Extract file ID from Google Drive URL"""
-        if '/file/d/' in url:
-            file_id = url.split('/file/d/')[1].split('/')[0]
-            return file_id
-        elif 'id=' in url:
-            file_id = url.split('id=')[1].split('&')[0]
-            return file_id
-        return None
+        match = _DRIVE_ID_RE.search(url)
+        return match.group(1) if match else None
     
     def download_file(self, drive_url: str, filename: Optional[str] = None) -> str:
         """Download file from Google Drive"""
@@ -58,28 +124,64 @@ class DriveDownloader:
             if not filename:
                 filename = file_metadata.get('name', f'download_{file_id}')
             
-            # Download file using Google API client
-            from io import BytesIO
-            from googleapiclient.http import MediaIoBaseDownload
-            
+            # Download file using Google API client, straight to disk
             request = service.files().get_media(fileId=file_id)
-            file_handle = BytesIO()
-            downloader = MediaIoBaseDownload(file_handle, request)
-            
-            done = False
-            while done is False:
-                status, done = downloader.next_chunk()
-                if status:
-                    print(f"Download progress: {int(status.progress() * 100)}%")
-            
-            file_path = self.temp_dir / filename
-            with open(file_path, 'wb') as f:
-                f.write(file_handle.getvalue())
+            file_path = _ensure_temp_dir() / filename
+            try:
+                with open(file_path, 'wb') as file_handle:
+                    downloader = MediaIoBaseDownload(file_handle, request, chunksize=STREAM_CHUNK_SIZE)
+                    
+                    done = False
+                    while done is False:
+                        status, done = downloader.next_chunk()
+                        if status:
+                            print(f"Download progress: {int(status.progress() * 100)}%")
+            except Exception:
+                # Don't leave a partial file behind
+                self.cleanup_file(str(file_path))
+                raise
             
             return str(file_path)
         except HttpError as e:
             raise Exception(f"Drive download error: {e}")
     
+    def get_file_checksum(self, drive_url: str) -> Optional[str]:
+        """Get a Drive file's MD5 checksum without downloading it (None for Google-native files)"""
+        file_id = self._extract_file_id(drive_url)
+        if not file_id:
+            raise ValueError("Invalid Google Drive URL")
+        
+        try:
+            file_metadata = self._get_service().files().get(fileId=file_id, fields='md5Checksum').execute()
+        except HttpError as e:
+            raise Exception(f"Drive metadata error: {e}")
+        
+        return file_metadata.get('md5Checksum')
+    
+    def stream_file(self, drive_url: str) -> DriveMediaUpload:
+        """Open a Drive file as an upload source that is read chunk by chunk"""
+        file_id = self._extract_file_id(drive_url)
+        if not file_id:
+            raise ValueError("Invalid Google Drive URL")
+        
+        service = self._get_service()
+        
+        try:
+            file_metadata = service.files().get(fileId=file_id, fields='size,mimeType').execute()
+        except HttpError as e:
+            raise Exception(f"Drive download error: {e}")
+        
+        if 'size' not in file_metadata:
+            raise ValueError("Drive file has no downloadable content")
+        
+        mimetype = file_metadata.get('mimeType', '')
+        return DriveMediaUpload(
+            self._get_service,
+            file_id,
+            int(file_metadata['size']),
+            mimetype if mimetype.startswith('video/') else 'video/*'
+        )
+    
     def cleanup_file(self, file_path: str):
         """Delete temporary file"""
         try:
@@ -87,3 +189,20 @@ class DriveDownloader:
                 os.remove(file_path)
         except Exception as e:
             print(f"Error cleaning up file {file_path}: {e}")
+
+
+# Downloaders shared across requests, keyed by (user_id, channel_id); see
+# app.youtube.client.get_or_create_client
+_downloader_cache = TTLCache(maxsize=1024, ttl=3600)
+_downloader_cache_lock = threading.Lock()
+
+
+def get_or_create_downloader(user_id: str, channel_id: str) -> DriveDownloader:
+    """Shared DriveDownloader for a channel, rebuilt when its stored token changes"""
+    token_data = storage_manager.get_token(user_id, channel_id)
+    key = (user_id, channel_id)
+    with _downloader_cache_lock:
+        downloader = _downloader_cache.get(key)
+        if downloader is None or (downloader.token_data is not None and downloader.token_data != token_data):
+            downloader = _downloader_cache[key] = DriveDownloader(user_id, channel_id)
+    return downloader
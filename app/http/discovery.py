@@ -0,0 +1,59 @@
+from functools import lru_cache
+from google.oauth2.credentials import Credentials
+from googleapiclient.discovery import Resource, build_from_document, fix_method_name
+from googleapiclient.discovery_cache import get_static_doc
+from googleapiclient.errors import UnknownApiNameOrVersion
+from googleapiclient.model import JsonModel
+from app.http.pool import authorized_http
+from typing import Any, Dict
+import httplib2
+import orjson
+
+
+class OrjsonModel(JsonModel):
+    """
+    JsonModel that parses response bodies with orjson.
+    
+    Request bodies keep JsonModel's ASCII-escaped json.dumps: httplib2 sends
+    a str body as Latin-1, which would mangle non-ASCII titles.
+    """
+    
+    def deserialize(self, content):
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return content.decode('utf-8') if isinstance(content, bytes) else content
+        if self._data_wrapper and "data" in body:
+            body = body["data"]
+        return body
+
+
+def _prime_resources(resource: Resource, description: Dict[str, Any]):
+    """Instantiate every nested resource of a service once"""
+    for name, nested in description.get('resources', {}).items():
+        _prime_resources(getattr(resource, fix_method_name(name))(), nested)
+
+
+@lru_cache(maxsize=None)
+def discovery_document(service_name: str, version: str) -> Dict[str, Any]:
+    """Parsed discovery document bundled with the client library (shared, do not mutate)"""
+    content = get_static_doc(service_name, version)
+    if content is None:
+        raise UnknownApiNameOrVersion(f"name: {service_name}  version: {version}")
+    
+    document = orjson.loads(content)
+    # googleapiclient adds the standard parameters to a method's description
+    # the first time its resource is used. Do that for every resource now so
+    # services built later from this document only read it, from any thread.
+    _prime_resources(build_from_document(document, http=httplib2.Http()), document)
+    return document
+
+
+def build_service(service_name: str, version: str, credentials: Credentials) -> Resource:
+    """Build an API service on this thread's connection pool without re-parsing its discovery document"""
+    document = discovery_document(service_name, version)
+    return build_from_document(
+        document,
+        http=authorized_http(credentials),
+        model=OrjsonModel('dataWrapper' in document.get('features', []))
+    )
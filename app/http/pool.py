@@ -0,0 +1,44 @@
+from google.auth.transport.requests import Request
+from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.http import build_http, set_user_agent
+from requests.adapters import HTTPAdapter
+import httplib2
+import requests
+import threading
+
+# httplib2.Http is not thread-safe, so each thread keeps one connection pool
+# that all of its YouTube and Drive clients share
+_local = threading.local()
+
+# Sent with every Google API request. Google compresses responses only when the
+# user agent contains "gzip"; the client library adds that to API calls but not
+# to raw requests such as resumable upload chunks.
+USER_AGENT = "youtube-scheduler/1.0.0 (gzip)"
+
+
+def get_http() -> httplib2.Http:
+    """Get this thread's shared httplib2 connection pool"""
+    http = getattr(_local, 'http', None)
+    if http is None:
+        # build_http sets the client library's timeout and stops httplib2 from
+        # following 308, which resumable uploads use for "resume incomplete"
+        http = _local.http = set_user_agent(build_http(), USER_AGENT)
+    return http
+
+
+# Token refreshes go through requests, whose Session is safe to share between
+# threads; one keep-alive pool avoids a TLS handshake per refresh
+_auth_session = requests.Session()
+_auth_session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=3))
+_auth_request = Request(session=_auth_session)
+
+
+def auth_request() -> Request:
+    """google.auth transport for token refreshes, on the shared session"""
+    return _auth_request
+
+
+def authorized_http(credentials: Credentials) -> AuthorizedHttp:
+    """Wrap this thread's connection pool with credentials for one client"""
+    return AuthorizedHttp(credentials, http=get_http())
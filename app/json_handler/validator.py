@@ -1,8 +1,11 @@
 from app.models.video import VideoScheduleRequest, VideoSchedule
 from typing import List, Dict, Any
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 
+# Built once at import; validates a whole 'videos' array in one core call
+_videos_adapter = TypeAdapter(List[VideoSchedule])
+
 class JSONValidator:
     """Validates JSON video schedule requests"""
     
@@ -29,16 +32,24 @@ class JSONValidator:
         if len(data["videos"]) == 0:
             return False, [], [{"error": "'videos' array cannot be empty"}]
         
-        for idx, video_data in enumerate(data["videos"]):
-            try:
-                video = VideoSchedule(**video_data)
-                valid_videos.append(video)
-            except ValidationError as e:
-                errors.append({
-                    "index": idx,
-                    "video": video_data.get("title", "Unknown"),
-                    "errors": [err["msg"] for err in e.errors()]
-                })
+        try:
+            valid_videos = _videos_adapter.validate_python(data["videos"])
+        except ValidationError as e:
+            # Group the batch errors back into per-video entries
+            messages_by_index: Dict[int, List[str]] = {}
+            for err in e.errors():
+                messages_by_index.setdefault(err["loc"][0], []).append(err["msg"])
+            
+            for idx, video_data in enumerate(data["videos"]):
+                if idx in messages_by_index:
+                    title = video_data.get("title", "Unknown") if isinstance(video_data, dict) else "Unknown"
+                    errors.append({
+                        "index": idx,
+                        "video": title,
+                        "errors": messages_by_index[idx]
+                    })
+                else:
+                    valid_videos.append(VideoSchedule.model_validate(video_data))
         
         is_valid = len(valid_videos) > 0
         return is_valid, valid_videos, errors
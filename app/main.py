@@ -1,15 +1,24 @@
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.api import auth, youtube, videos
+from app.config.logging_config import setup_logging
+from app.auth.password import calibrate_bcrypt_rounds
+from app.json_handler.validator import JSONValidator
+from app.http.discovery import discovery_document
+from app.models.user import UserCreate
+from app.storage.storage_manager import storage_manager
 from pathlib import Path
 import os
 
+setup_logging()
+
 app = FastAPI(
     title="YouTube Video Scheduling Automation",
     description="Automate YouTube video uploads and scheduling from Google Drive",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware for better compatibility
@@ -26,6 +35,28 @@ app.include_router(auth.router)
 app.include_router(youtube.router)
 app.include_router(videos.router)
 
+
+@app.on_event("startup")
+async def calibrate_password_hashing():
+    """Size the bcrypt cost to this machine before serving logins"""
+    calibrate_bcrypt_rounds()
+
+
+@app.on_event("startup")
+async def warm_up():
+    """Take first-use costs before the first request instead of during it"""
+    # Email validation loads its helper modules lazily on first use
+    UserCreate(email="warm-up@example.com", password="warm-up")
+    JSONValidator.validate_request({
+        "videos": [{"title": "warm-up", "video_drive_url": "warm-up", "publish_datetime": "2024-01-01T00:00:00"}]
+    })
+    # Parse the users file and build its email index
+    storage_manager.get_user_by_email("")
+    # Parse the API discovery documents every YouTube/Drive service is built from
+    discovery_document("youtube", "v3")
+    discovery_document("drive", "v3")
+
+
 # Serve frontend
 frontend_dir = Path(__file__).parent / "frontend"
 if frontend_dir.exists():
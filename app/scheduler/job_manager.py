@@ -1,18 +1,94 @@
 from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.executors.pool import ThreadPoolExecutor
+from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 from apscheduler.triggers.date import DateTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 from datetime import datetime
-from app.youtube.client import YouTubeClient
+from pathlib import Path
+from app.youtube.client import get_or_create_client
 from app.storage.storage_manager import storage_manager
-from typing import Callable
+from app.config.settings import settings
+from typing import Callable, Optional
+import os
 import uuid
 
+try:
+    import fcntl
+except ImportError:  # Windows: single-process development only
+    fcntl = None
+
+# Worker threads for scheduled jobs; publishing is network-bound and gets its own pool
+DEFAULT_EXECUTOR_WORKERS = 32
+NETWORK_EXECUTOR_WORKERS = 16
+
+# How often the running scheduler looks for jobs stored by other server workers
+JOBSTORE_POLL_SECONDS = 30
+
+
+def poll_jobstore():
+    """No-op job; each run wakes the scheduler, which then re-reads the jobstore"""
+
+
+def publish_video(user_id: str, channel_id: str, video_id: str, job_id: str):
+    """Make a scheduled video public and record the outcome on its job"""
+    try:
+        client = get_or_create_client(user_id, channel_id)
+        client.update_video_privacy(video_id, "public")
+        
+        # Update job status
+        storage_manager.update_job_status(job_id, "published", video_id=video_id)
+    except Exception as e:
+        storage_manager.update_job_status(
+            job_id,
+            "failed",
+            error_message=str(e),
+            video_id=video_id
+        )
+
 
 class JobManager:
     """Manages scheduled video publishing jobs"""
     
     def __init__(self):
-        self.scheduler = BackgroundScheduler()
-        self.scheduler.start()
+        # Jobs are kept in SQLite so scheduled publishes survive restarts
+        Path(settings.scheduler_db_file).parent.mkdir(parents=True, exist_ok=True)
+        self.scheduler = BackgroundScheduler(
+            jobstores={
+                'default': SQLAlchemyJobStore(url=f"sqlite:///{settings.scheduler_db_file}")
+            },
+            executors={
+                'default': ThreadPoolExecutor(DEFAULT_EXECUTOR_WORKERS),
+                'network': ThreadPoolExecutor(NETWORK_EXECUTOR_WORKERS)
+            }
+        )
+        
+        # With several server workers, only the one holding the scheduler lock
+        # runs jobs; the others start paused and just write jobs to the store
+        self._lock_fd = self._acquire_scheduler_lock()
+        if fcntl is None or self._lock_fd is not None:
+            self.scheduler.start()
+            self.scheduler.add_job(
+                poll_jobstore,
+                trigger=IntervalTrigger(seconds=JOBSTORE_POLL_SECONDS),
+                id='poll-jobstore',
+                coalesce=True,
+                replace_existing=True
+            )
+        else:
+            self.scheduler.start(paused=True)
+    
+    def _acquire_scheduler_lock(self) -> Optional[int]:
+        """Take the process-wide scheduler lock if no other worker holds it"""
+        if fcntl is None:
+            return None
+        fd = os.open(f"{settings.scheduler_db_file}.lock", os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return None
+        # Held until the process exits
+        return fd
     
     def schedule_publish(
         self,
@@ -23,27 +99,14 @@ class JobManager:
         job_id: str
     ):
         """Schedule a video to be published at a specific datetime"""
-        
-        def publish_video():
-            try:
-                client = YouTubeClient(user_id, channel_id)
-                client.update_video_privacy(video_id, "public")
-                
-                # Update job status
-                storage_manager.update_job_status(job_id, "published", video_id=video_id)
-            except Exception as e:
-                storage_manager.update_job_status(
-                    job_id,
-                    "failed",
-                    error_message=str(e),
-                    video_id=video_id
-                )
-        
-        # Schedule the job
+        # Schedule the job; if the app was down at publish time, run it on startup
         self.scheduler.add_job(
             publish_video,
             trigger=DateTrigger(run_date=publish_datetime),
+            args=[user_id, channel_id, video_id, job_id],
             id=job_id,
+            executor='network',
+            misfire_grace_time=None,
             replace_existing=True
         )
     
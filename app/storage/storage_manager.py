@@ -1,179 +1,437 @@
-import json
+import heapq
+import logging
+import orjson
 import os
-from typing import Dict, List, Any, Optional
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 from app.config.settings import settings
 
+try:
+    import fcntl
+except ImportError:  # Windows: single-process development only
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# IDs used as file names must not be able to escape their directory
+_SAFE_KEY = re.compile(r'^[A-Za-z0-9_-]+$')
+
+# Entries kept by the get_user/get_token record memo
+RECORD_CACHE_SIZE = 10_000
+
+
+class _StorageLock:
+    """
+    Reentrant lock shared by the threads of this process and, through
+    flock on a lock file, by the other server worker processes.
+    """
+    
+    def __init__(self, lock_path: Path):
+        self._lock_path = lock_path
+        self._thread_lock = threading.RLock()
+        self._fd: Optional[int] = None
+        self._depth = 0
+    
+    def __enter__(self):
+        self._thread_lock.acquire()
+        if self._depth == 0 and fcntl is not None:
+            try:
+                if self._fd is None:
+                    self._fd = os.open(self._lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+                fcntl.flock(self._fd, fcntl.LOCK_EX)
+            except BaseException:
+                self._thread_lock.release()
+                raise
+        self._depth += 1
+        return self
+    
+    def __exit__(self, *exc_info):
+        self._depth -= 1
+        if self._depth == 0 and fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        self._thread_lock.release()
+
 
 class StorageManager:
-    """Manages JSON-based storage operations"""
+    """Manages JSON-based storage operations
+    
+    Users and recent videos live in one file each. Jobs, YouTube tokens and
+    failed videos are sharded so a mutation only rewrites one small file:
+    jobs/{user_id}/{job_id}.json, tokens/{user_id}.json and
+    failed_videos/{user_id}.json.
+    
+    Parsed files are kept in memory and re-read only when the file changes
+    on disk. Cached data is shared, so public getters hand out copies of the
+    records they return and mutators build new containers instead of editing
+    cached ones.
+    """
     
     def __init__(self):
         self.storage_dir = Path(settings.storage_dir)
         self.storage_dir.mkdir(exist_ok=True)
         
         self.users_file = Path(settings.users_file)
+        self.recent_videos_file = Path(settings.recent_videos_file)
+        self.jobs_dir = Path(settings.jobs_dir)
+        self.tokens_dir = Path(settings.tokens_dir)
+        self.failed_videos_dir = Path(settings.failed_videos_dir)
+        
+        # Single-file layout used before sharding; migrated once on startup
         self.tokens_file = Path(settings.tokens_file)
         self.jobs_file = Path(settings.jobs_file)
-        self.recent_videos_file = Path(settings.recent_videos_file)
         self.failed_videos_file = Path(settings.failed_videos_file)
         
-        self._ensure_files_exist()
+        # file path -> ((inode, mtime_ns, size), parsed contents)
+        self._cache: Dict[Path, Tuple[Tuple[int, int, int], Any]] = {}
+        # Serializes read-modify-write cycles across threads (the publish scheduler
+        # writes from worker threads) and across server worker processes
+        self._lock = _StorageLock(self.storage_dir / '.lock')
+        # (parsed users file it was built from, email -> user_id)
+        self._email_index: Tuple[Optional[Dict[str, Any]], Dict[str, str]] = (None, {})
+        # (file path, key) -> (signature of the file version it came from, record), least recently used first
+        self._records: "OrderedDict[Tuple[Path, str], Tuple[Optional[Tuple[int, int, int]], Optional[Dict[str, Any]]]]" = OrderedDict()
+        self._records_lock = threading.Lock()
+        
+        with self._lock:
+            self._ensure_files_exist()
+            self._migrate_legacy_files()
     
     def _ensure_files_exist(self):
-        """Create JSON files if they don't exist"""
-        for file_path in [self.users_file, self.tokens_file, self.jobs_file, 
-                          self.recent_videos_file, self.failed_videos_file]:
+        """Create JSON files and shard directories if they don't exist"""
+        for file_path in [self.users_file, self.recent_videos_file]:
             if not file_path.exists():
                 file_path.parent.mkdir(parents=True, exist_ok=True)
                 self._write_json(file_path, {})
+        for dir_path in [self.jobs_dir, self.tokens_dir, self.failed_videos_dir]:
+            dir_path.mkdir(parents=True, exist_ok=True)
+    
+    def _migrate_legacy_files(self):
+        """Split single-file jobs/tokens/failed videos into shards"""
+        # Keys that cannot be file names are left behind in the renamed
+        # legacy file, so log them for manual recovery
+        legacy_jobs = self._read_json(self.jobs_file)
+        for job_id, job_data in legacy_jobs.items():
+            if _SAFE_KEY.match(job_id) and _SAFE_KEY.match(str(job_data.get('user_id', ''))):
+                self._write_json(self._job_path(job_data['user_id'], job_id), job_data)
+            else:
+                logger.warning("Not migrating job %r of user %r from %s: invalid storage key", job_id, job_data.get('user_id'), self.jobs_file)
+        
+        legacy_tokens = self._read_json(self.tokens_file)
+        for user_id, user_tokens in legacy_tokens.items():
+            if _SAFE_KEY.match(user_id):
+                self._write_json(self._shard_path(self.tokens_dir, user_id), user_tokens)
+            else:
+                logger.warning("Not migrating tokens of user %r from %s: invalid storage key", user_id, self.tokens_file)
+        
+        legacy_failed = self._read_json(self.failed_videos_file)
+        for user_id, user_failed in legacy_failed.items():
+            if _SAFE_KEY.match(user_id):
+                self._write_json(self._shard_path(self.failed_videos_dir, user_id), user_failed)
+            else:
+                logger.warning("Not migrating failed videos of user %r from %s: invalid storage key", user_id, self.failed_videos_file)
+        
+        # Keep the old files around, renamed, in case a rollback is needed
+        for file_path in [self.jobs_file, self.tokens_file, self.failed_videos_file]:
+            if file_path.exists():
+                file_path.replace(file_path.with_name(file_path.name + '.migrated'))
     
     def _read_json(self, file_path: Path) -> Dict[str, Any]:
-        """Read JSON file"""
-        if not file_path.exists():
-            return {}
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        """Read JSON file, from memory unless it changed on disk (do not mutate the result)"""
+        return self._read_json_signed(file_path)[1]
+    
+    def _read_json_signed(self, file_path: Path) -> Tuple[Optional[Tuple[int, int, int]], Dict[str, Any]]:
+        """(on-disk signature, parsed content) of a JSON file; the signature is None if it is missing"""
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            return None, {}
+        signature = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        
+        cached = self._cache.get(file_path)
+        if cached is not None and cached[0] == signature:
+            return cached
+        
+        with open(file_path, 'rb') as f:
+            data = orjson.loads(f.read())
+        self._cache[file_path] = (signature, data)
+        return signature, data
     
     def _write_json(self, file_path: Path, data: Dict[str, Any]):
-        """Write JSON file"""
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+        """Write JSON file atomically (readers never see a partial file)"""
+        tmp_path = file_path.with_name(f"{file_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            f = open(tmp_path, 'wb')
+        except FileNotFoundError:
+            # First write into a new shard directory
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            f = open(tmp_path, 'wb')
+        with f:
+            f.write(orjson.dumps(data, default=str))
+        os.replace(tmp_path, file_path)
+        # Re-parsed on next read; callers may still hold and change data
+        self._cache.pop(file_path, None)
+    
+    def _get_record(self, file_path: Path, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Record stored under key in a JSON file, shared between callers.
+        
+        One copy is made per version of the file and reused until the file
+        changes on disk (any write, here or in another process), so hot
+        lookups like get_user don't copy the record on every call. Entries
+        hold the file signature, not the parse, so old parses are freed.
+        Callers must not mutate the record.
+        """
+        signature, data = self._read_json_signed(file_path)
+        cache_key = (file_path, key)
+        with self._records_lock:
+            cached = self._records.get(cache_key)
+            if cached is not None and cached[0] == signature:
+                self._records.move_to_end(cache_key)
+                return cached[1]
+        
+        record = data.get(key)
+        if record is not None:
+            record = dict(record)
+        with self._records_lock:
+            self._records[cache_key] = (signature, record)
+            self._records.move_to_end(cache_key)
+            if len(self._records) > RECORD_CACHE_SIZE:
+                self._records.popitem(last=False)
+        return record
+    
+    def _shard_path(self, dir_path: Path, key: str) -> Path:
+        """Path of the per-key shard file in dir_path"""
+        if not _SAFE_KEY.match(key):
+            raise ValueError(f"Invalid storage key: {key!r}")
+        return dir_path / f"{key}.json"
+    
+    def _job_path(self, user_id: str, job_id: str) -> Path:
+        """Path of a job's shard file"""
+        if not _SAFE_KEY.match(user_id):
+            raise ValueError(f"Invalid storage key: {user_id!r}")
+        return self._shard_path(self.jobs_dir / user_id, job_id)
+    
+    def _find_job_path(self, job_id: str) -> Optional[Path]:
+        """Locate a job's shard file without knowing its user"""
+        if not _SAFE_KEY.match(job_id):
+            return None
+        with os.scandir(self.jobs_dir) as entries:
+            for user_dir in entries:
+                job_path = Path(user_dir.path) / f"{job_id}.json"
+                if user_dir.is_dir() and job_path.exists():
+                    return job_path
+        return None
+    
+    def _read_shards(self, dir_path: Path) -> Dict[str, Any]:
+        """Read every shard file in dir_path, keyed by file name without .json"""
+        if not dir_path.is_dir():
+            return {}
+        shards = {}
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                if entry.name.endswith('.json') and entry.is_file():
+                    shards[entry.name[:-5]] = self._read_json(Path(entry.path))
+        return shards
     
     # User operations
     def get_users(self) -> Dict[str, Any]:
         """Get all users"""
-        return self._read_json(self.users_file)
+        return {user_id: dict(user_data) for user_id, user_data in self._read_json(self.users_file).items()}
     
     def save_user(self, user_id: str, user_data: Dict[str, Any]):
         """Save or update user"""
-        users = self.get_users()
-        users[user_id] = user_data
-        self._write_json(self.users_file, users)
+        with self._lock:
+            users = dict(self._read_json(self.users_file))
+            users[user_id] = user_data
+            self._write_json(self.users_file, users)
     
     def get_user(self, user_id: str) -> Optional[Dict[str, Any]]:
-        """Get user by ID"""
-        users = self.get_users()
-        return users.get(user_id)
+        """Get user by ID (shared record, do not mutate)"""
+        return self._get_record(self.users_file, user_id)
+    
+    def _get_email_index(self, users: Dict[str, Any]) -> Dict[str, str]:
+        """email -> user_id for the parsed users file, rebuilt whenever the file is re-read"""
+        indexed_users, index = self._email_index
+        if indexed_users is not users:
+            index = {}
+            for user_id, user_data in users.items():
+                index.setdefault(user_data.get('email'), user_id)
+            self._email_index = (users, index)
+        return index
     
     def get_user_by_email(self, email: str) -> Optional[Dict[str, Any]]:
         """Get user by email"""
-        users = self.get_users()
-        for user_id, user_data in users.items():
-            if user_data.get('email') == email:
-                return {**user_data, 'id': user_id}
-        return None
+        users = self._read_json(self.users_file)
+        user_id = self._get_email_index(users).get(email)
+        if user_id is None:
+            return None
+        return {**users[user_id], 'id': user_id}
     
     # Token operations
     def get_tokens(self) -> Dict[str, Any]:
         """Get all YouTube tokens"""
-        return self._read_json(self.tokens_file)
+        return {
+            user_id: {channel_id: dict(token) for channel_id, token in user_tokens.items()}
+            for user_id, user_tokens in self._read_shards(self.tokens_dir).items()
+        }
     
     def save_token(self, user_id: str, channel_id: str, token_data: Dict[str, Any]):
         """Save or update YouTube token"""
-        tokens = self.get_tokens()
-        if user_id not in tokens:
-            tokens[user_id] = {}
-        tokens[user_id][channel_id] = token_data
-        self._write_json(self.tokens_file, tokens)
+        shard_path = self._shard_path(self.tokens_dir, user_id)
+        with self._lock:
+            tokens = dict(self._read_json(shard_path))
+            tokens[channel_id] = token_data
+            self._write_json(shard_path, tokens)
+    
+    def delete_token(self, user_id: str, channel_id: str):
+        """Remove a YouTube token"""
+        shard_path = self._shard_path(self.tokens_dir, user_id)
+        with self._lock:
+            tokens = dict(self._read_json(shard_path))
+            if tokens.pop(channel_id, None) is not None:
+                self._write_json(shard_path, tokens)
     
     def get_user_tokens(self, user_id: str) -> Dict[str, Any]:
         """Get all tokens for a user"""
-        tokens = self.get_tokens()
-        return tokens.get(user_id, {})
+        if not _SAFE_KEY.match(user_id):
+            return {}
+        tokens = self._read_json(self._shard_path(self.tokens_dir, user_id))
+        return {channel_id: dict(token) for channel_id, token in tokens.items()}
     
     def get_token(self, user_id: str, channel_id: str) -> Optional[Dict[str, Any]]:
-        """Get specific token"""
-        tokens = self.get_user_tokens(user_id)
-        return tokens.get(channel_id)
+        """Get specific token (shared record, do not mutate)"""
+        if not _SAFE_KEY.match(user_id):
+            return None
+        return self._get_record(self._shard_path(self.tokens_dir, user_id), channel_id)
     
     # Job operations
     def get_jobs(self) -> Dict[str, Any]:
         """Get all scheduled jobs"""
-        return self._read_json(self.jobs_file)
+        jobs = {}
+        with os.scandir(self.jobs_dir) as entries:
+            for user_dir in entries:
+                if user_dir.is_dir():
+                    for job_id, job in self._read_shards(Path(user_dir.path)).items():
+                        jobs[job_id] = dict(job)
+        return jobs
     
     def save_job(self, job_id: str, job_data: Dict[str, Any]):
         """Save or update job"""
-        jobs = self.get_jobs()
-        jobs[job_id] = job_data
-        self._write_json(self.jobs_file, jobs)
+        with self._lock:
+            self._write_json(self._job_path(job_data['user_id'], job_id), job_data)
     
     def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
         """Get job by ID"""
-        jobs = self.get_jobs()
-        return jobs.get(job_id)
+        job_path = self._find_job_path(job_id)
+        return dict(self._read_json(job_path)) if job_path else None
     
     def get_user_jobs(self, user_id: str) -> List[Dict[str, Any]]:
         """Get all jobs for a user"""
-        jobs = self.get_jobs()
-        return [job for job in jobs.values() if job.get('user_id') == user_id]
+        if not _SAFE_KEY.match(user_id):
+            return []
+        return [dict(job) for job in self._read_shards(self.jobs_dir / user_id).values()]
+    
+    def get_user_jobs_signature(self, user_id: str) -> Optional[Tuple[int, int]]:
+        """
+        (inode, mtime_ns) of a user's job directory, or None if it has no jobs.
+        
+        Every job write replaces a file in that directory, so the signature
+        changes whenever any process saves or updates one of the user's jobs.
+        """
+        if not _SAFE_KEY.match(user_id):
+            return None
+        try:
+            stat = os.stat(self.jobs_dir / user_id)
+        except FileNotFoundError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns)
     
     def update_job_status(self, job_id: str, status: str, error_message: Optional[str] = None, video_id: Optional[str] = None):
         """Update job status"""
-        jobs = self.get_jobs()
-        if job_id in jobs:
-            jobs[job_id]['status'] = status
-            if error_message:
-                jobs[job_id]['error_message'] = error_message
-            if video_id:
-                jobs[job_id]['video_id'] = video_id
-            self._write_json(self.jobs_file, jobs)
+        with self._lock:
+            job_path = self._find_job_path(job_id)
+            if job_path:
+                job = dict(self._read_json(job_path))
+                job['status'] = status
+                if error_message:
+                    job['error_message'] = error_message
+                if video_id:
+                    job['video_id'] = video_id
+                self._write_json(job_path, job)
+    
+    def bulk_update_job_status(self, user_id: str, updates: List[Tuple[str, str, Optional[str]]]):
+        """Update the status of many of a user's jobs under one lock hold
+        
+        Each update is a (job_id, status, video_id) tuple. Every job is its
+        own shard, so each changed job is still one file write; missing
+        jobs are skipped.
+        """
+        with self._lock:
+            for job_id, status, video_id in updates:
+                job_path = self._job_path(user_id, job_id)
+                job = self._read_json(job_path)
+                if not job:
+                    continue
+                job = {**job, 'status': status}
+                if video_id:
+                    job['video_id'] = video_id
+                self._write_json(job_path, job)
     
     # Recent videos operations
     def get_recent_videos(self) -> Dict[str, Any]:
         """Get all recent videos (organized by user_id -> channel_id -> list)"""
-        return self._read_json(self.recent_videos_file)
+        return {
+            user_id: {channel_id: list(videos) for channel_id, videos in channels.items()}
+            for user_id, channels in self._read_json(self.recent_videos_file).items()
+        }
     
     def save_recent_videos(self, user_id: str, channel_id: str, videos: List[Dict[str, Any]], max_entries: int = 20):
         """Save recent videos for a channel, keeping only the most recent max_entries"""
-        all_recent = self.get_recent_videos()
+        # Keep only the max_entries most recent (newest first), without sorting the rest
+        videos_sorted = heapq.nlargest(max_entries, videos, key=lambda x: x.get('date', ''))
         
-        if user_id not in all_recent:
-            all_recent[user_id] = {}
-        
-        # Sort by date (most recent first) and keep only max_entries
-        videos_sorted = sorted(videos, key=lambda x: x.get('date', ''), reverse=True)[:max_entries]
-        all_recent[user_id][channel_id] = videos_sorted
-        
-        self._write_json(self.recent_videos_file, all_recent)
+        with self._lock:
+            all_recent = dict(self._read_json(self.recent_videos_file))
+            all_recent[user_id] = {**all_recent.get(user_id, {}), channel_id: videos_sorted}
+            self._write_json(self.recent_videos_file, all_recent)
     
     def get_channel_recent_videos(self, user_id: str, channel_id: str) -> List[Dict[str, Any]]:
         """Get recent videos for a specific channel"""
-        all_recent = self.get_recent_videos()
-        return all_recent.get(user_id, {}).get(channel_id, [])
+        all_recent = self._read_json(self.recent_videos_file)
+        return list(all_recent.get(user_id, {}).get(channel_id, []))
     
     # Failed videos operations
     def get_failed_videos(self) -> Dict[str, Any]:
         """Get all failed videos (organized by user_id -> channel_id -> list)"""
-        return self._read_json(self.failed_videos_file)
+        return {
+            user_id: {channel_id: list(videos) for channel_id, videos in channels.items()}
+            for user_id, channels in self._read_shards(self.failed_videos_dir).items()
+        }
     
     def save_failed_video(self, user_id: str, channel_id: str, failed_video: Dict[str, Any], max_entries: int = 20):
         """Save a failed video, keeping only the most recent max_entries"""
-        all_failed = self.get_failed_videos()
-        
-        if user_id not in all_failed:
-            all_failed[user_id] = {}
-        
-        if channel_id not in all_failed[user_id]:
-            all_failed[user_id][channel_id] = []
-        
-        # Add new failure
-        all_failed[user_id][channel_id].append(failed_video)
+        shard_path = self._shard_path(self.failed_videos_dir, user_id)
+        with self._lock:
+            user_failed = dict(self._read_json(shard_path))
         
-        # Sort by failure_time (most recent first) and keep only max_entries
-        all_failed[user_id][channel_id] = sorted(
-            all_failed[user_id][channel_id],
-            key=lambda x: x.get('failure_time', ''),
-            reverse=True
-        )[:max_entries]
+            # Add new failure and keep the max_entries most recent by failure_time (newest first)
+            user_failed[channel_id] = heapq.nlargest(
+                max_entries,
+                user_failed.get(channel_id, []) + [failed_video],
+                key=lambda x: x.get('failure_time', '')
+            )
         
-        self._write_json(self.failed_videos_file, all_failed)
+            self._write_json(shard_path, user_failed)
     
     def get_channel_failed_videos(self, user_id: str, channel_id: str) -> List[Dict[str, Any]]:
         """Get failed videos for a specific channel"""
-        all_failed = self.get_failed_videos()
-        return all_failed.get(user_id, {}).get(channel_id, [])
+        if not _SAFE_KEY.match(user_id):
+            return []
+        user_failed = self._read_json(self._shard_path(self.failed_videos_dir, user_id))
+        return list(user_failed.get(channel_id, []))
 
 
 storage_manager = StorageManager()
@@ -1,10 +1,105 @@
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import MediaFileUpload, MediaUpload
 from google.oauth2.credentials import Credentials
-from app.youtube.oauth import get_credentials_from_token, refresh_credentials
+from cachetools import TTLCache
+from app.youtube.oauth import get_cached_credentials
+from app.http.discovery import build_service
 from app.storage.storage_manager import storage_manager
-from typing import Dict, Any, Optional, List
-from datetime import datetime, timezone
+from typing import Dict, Any, Optional, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from operator import itemgetter
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+# Partial responses: ask YouTube only for the properties read below, as compact JSON
+_UPLOADS_PLAYLIST_FIELDS = 'items/contentDetails/relatedPlaylists/uploads'
+_PLAYLIST_ITEMS_FIELDS = 'items/contentDetails/videoId,nextPageToken'
+_VIDEO_LIST_FIELDS = 'items(id,snippet(title,description,publishedAt,thumbnails/default/url),status(privacyStatus,uploadStatus,publishAt))'
+_VIDEO_STATUS_FIELDS = 'items(id,snippet(title,description),status(privacyStatus,publishAt))'
+_CHANNEL_FIELDS = 'etag,items(id,snippet(title,description,thumbnails/default/url),statistics/subscriberCount,contentDetails/relatedPlaylists/uploads)'
+
+# get_scheduled_videos stops paging at uploads older than this (see there)
+SCHEDULED_SCAN_WINDOW = timedelta(days=30)
+
+# (uploadStatus, privacyStatus, has publishAt) -> status shown for a channel
+# video; other uploaded videos count as private, anything else keeps its uploadStatus
+_VIDEO_STATUS_MAP = {
+    ('uploaded', 'public', False): 'published',
+    ('uploaded', 'public', True): 'published',
+    ('uploaded', 'private', True): 'scheduled',
+    ('uploaded', 'unlisted', True): 'scheduled',
+    ('uploaded', 'private', False): 'private',
+    ('uploaded', 'unlisted', False): 'private',
+}
+
+# Resource parts written by videos.insert; must match the keys of the upload body
+_UPLOAD_PARTS = 'snippet,status'
+
+# Bytes sent per resumable upload request for local video files; a failed
+# chunk is retried on its own (must be a multiple of 256KB)
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Calls Google accepts in one batch request
+_BATCH_LIMIT = 50
+
+# Fetches videos.list details for one playlist page while the next page is
+# requested; each worker thread builds its own service
+_details_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='youtube-details')
+
+# (user_id, channel_id) -> (etag, channel info) of the last channels.list answer,
+# revalidated with If-None-Match so an unchanged channel costs an empty 304
+_channel_info_cache = TTLCache(maxsize=1024, ttl=24 * 3600)
+
+# channel_id -> uploads playlist ID, which never changes for a channel
+_uploads_playlist_ids: Dict[str, str] = {}
+
+# Guards both caches above; held only around their lookups and updates
+_channel_cache_lock = threading.Lock()
+
+def _publish_at(publish_datetime: datetime) -> str:
+    """RFC 3339 UTC timestamp for publishAt; a naive datetime is assumed to be UTC already"""
+    if publish_datetime.tzinfo:
+        publish_datetime = publish_datetime.astimezone(timezone.utc)
+    return publish_datetime.strftime('%Y-%m-%dT%H:%M:%S.000Z')
+
+
+def _collect_scheduled(videos: List[Dict[str, Any]], scheduled_videos: List[Dict[str, Any]], scan_cutoff: str) -> bool:
+    """
+    Append the scheduled videos among one page of videos.list results.
+    
+    Returns False when the page had none and reaches uploads published
+    before scan_cutoff, i.e. older pages are not worth fetching.
+    """
+    found = False
+    reached_cutoff = False
+    for video in videos:
+        status = video.get('status', {})
+        privacy_status = status.get('privacyStatus', '')
+        publish_at = status.get('publishAt')
+        
+        # Scheduled videos are identified by:
+        # 1. privacyStatus == "private" (or "unlisted")
+        # 2. publishAt field exists (only present for scheduled videos)
+        if privacy_status in ['private', 'unlisted'] and publish_at:
+            # This is a scheduled video
+            found = True
+            scheduled_videos.append({
+                'video_id': video['id'],
+                'title': video['snippet']['title'],
+                'description': video['snippet'].get('description', ''),
+                'privacy_status': privacy_status,
+                'publish_at': publish_at,
+                'thumbnail': video['snippet'].get('thumbnails', {}).get('default', {}).get('url', '')
+            })
+        elif video.get('snippet', {}).get('publishedAt', scan_cutoff) < scan_cutoff:
+            reached_cutoff = True
+    
+    return found or not reached_cutoff
 
 
 class YouTubeClient:
@@ -13,63 +108,101 @@ class YouTubeClient:
     def __init__(self, user_id: str, channel_id: str):
         self.user_id = user_id
         self.channel_id = channel_id
-        self._service = None
+        # Stored token the credentials were built from
+        self.token_data: Optional[Dict[str, Any]] = None
+        self._credentials = None
+        self._credentials_lock = threading.Lock()
+        # Service objects wrap a non-thread-safe httplib2.Http, so each thread builds its own
+        self._local = threading.local()
+    
+    def _get_credentials(self) -> Credentials:
+        """Load the channel's credentials once per client"""
+        with self._credentials_lock:
+            if self._credentials is None:
+                self._credentials, self.token_data = get_cached_credentials(self.user_id, self.channel_id)
+            
+            return self._credentials
     
     def _get_service(self):
         """Get YouTube service with valid credentials"""
-        if self._service is None:
-            token_data = storage_manager.get_token(self.user_id, self.channel_id)
-            if not token_data:
-                raise ValueError("No token found for this channel")
-            
-            credentials = get_credentials_from_token(token_data)
-            credentials = refresh_credentials(credentials)
-            
-            # Update token if refreshed
-            if credentials.token != token_data.get("access_token"):
-                storage_manager.save_token(
-                    self.user_id,
-                    self.channel_id,
-                    {
-                        "access_token": credentials.token,
-                        "refresh_token": credentials.refresh_token,
-                        "token_uri": credentials.token_uri,
-                        "client_id": credentials.client_id,
-                        "client_secret": credentials.client_secret,
-                        "scopes": credentials.scopes,
-                        "expiry": credentials.expiry.isoformat() if credentials.expiry else None,
-                        "channel_id": self.channel_id,
-                        "channel_name": token_data.get("channel_name", ""),
-                        "created_at": token_data.get("created_at", datetime.utcnow().isoformat())
-                    }
-                )
-            
-            self._service = build('youtube', 'v3', credentials=credentials)
-        
-        return self._service
+        service = getattr(self._local, 'service', None)
+        if service is None:
+            service = self._local.service = build_service('youtube', 'v3', self._get_credentials())
+        return service
     
     def get_channel_info(self) -> Dict[str, Any]:
         """Get channel information"""
         service = self._get_service()
+        cache_key = (self.user_id, self.channel_id)
+        with _channel_cache_lock:
+            cached = _channel_info_cache.get(cache_key)
+        request = service.channels().list(
+            part='snippet,statistics,contentDetails',
+            mine=True,
+            fields=_CHANNEL_FIELDS,
+            prettyPrint=False
+        )
+        if cached is not None:
+            request.headers['If-None-Match'] = cached[0]
+        
         try:
-            response = service.channels().list(
-                part='snippet,statistics',
-                mine=True
+            response = request.execute()
+        except HttpError as e:
+            if cached is not None and e.resp.status == 304:
+                # Not modified since the cached answer
+                return dict(cached[1])
+            raise Exception(f"YouTube API error: {e}")
+        
+        if not response.get('items'):
+            raise ValueError("No channel found")
+        
+        channel = response['items'][0]
+        channel_info = {
+            "id": channel['id'],
+            "title": channel['snippet']['title'],
+            "subscriber_count": int(channel['statistics'].get('subscriberCount', 0)),
+            "description": channel['snippet'].get('description', ''),
+            "thumbnail": channel['snippet'].get('thumbnails', {}).get('default', {}).get('url', '')
+        }
+        
+        uploads_playlist_id = channel.get('contentDetails', {}).get('relatedPlaylists', {}).get('uploads')
+        with _channel_cache_lock:
+            if uploads_playlist_id:
+                _uploads_playlist_ids[self.channel_id] = uploads_playlist_id
+            if response.get('etag'):
+                _channel_info_cache[cache_key] = (response['etag'], channel_info)
+        return dict(channel_info)
+    
+    def _get_uploads_playlist_id(self) -> str:
+        """ID of the playlist holding all of the channel's uploads, looked up once per channel"""
+        with _channel_cache_lock:
+            uploads_playlist_id = _uploads_playlist_ids.get(self.channel_id)
+        if uploads_playlist_id is None:
+            response = self._get_service().channels().list(
+                part='contentDetails',
+                mine=True,
+                fields=_UPLOADS_PLAYLIST_FIELDS,
+                prettyPrint=False
             ).execute()
             
             if not response.get('items'):
                 raise ValueError("No channel found")
             
-            channel = response['items'][0]
-            return {
-                "id": channel['id'],
-                "title": channel['snippet']['title'],
-                "subscriber_count": int(channel['statistics'].get('subscriberCount', 0)),
-                "description": channel['snippet'].get('description', ''),
-                "thumbnail": channel['snippet'].get('thumbnails', {}).get('default', {}).get('url', '')
-            }
-        except HttpError as e:
-            raise Exception(f"YouTube API error: {e}")
+            uploads_playlist_id = response['items'][0]['contentDetails']['relatedPlaylists']['uploads']
+            with _channel_cache_lock:
+                _uploads_playlist_ids[self.channel_id] = uploads_playlist_id
+        return uploads_playlist_id
+    
+    def _list_videos(self, video_ids: List[str]) -> List[Dict[str, Any]]:
+        """videos.list snippet and status for up to 50 IDs, on the calling thread's service"""
+        videos_response = self._get_service().videos().list(
+            part='snippet,status',
+            id=','.join(video_ids),
+            maxResults=50,
+            fields=_VIDEO_LIST_FIELDS,
+            prettyPrint=False
+        ).execute()
+        return videos_response.get('items', [])
     
     def get_recent_videos(self, max_results: int = 20) -> List[Dict[str, Any]]:
         """
@@ -78,37 +211,39 @@ class YouTubeClient:
         """
         service = self._get_service()
         try:
-            all_videos = []
+            uploads_playlist_id = self._get_uploads_playlist_id()
+            detail_pages = []
+            requested = 0
             next_page_token = None
             
-            while len(all_videos) < max_results:
-                # Step 1: Use search.list to get video IDs for authenticated user
-                search_response = service.search().list(
-                    part='id,snippet',
-                    forMine=True,
-                    type='video',
-                    maxResults=min(50, max_results - len(all_videos)),
-                    order='date',  # Most recent first
-                    pageToken=next_page_token
+            while requested < max_results:
+                # Step 1: Get video IDs from the uploads playlist (most recent first)
+                page_response = service.playlistItems().list(
+                    part='contentDetails',
+                    playlistId=uploads_playlist_id,
+                    maxResults=min(50, max_results - requested),
+                    pageToken=next_page_token,
+                    fields=_PLAYLIST_ITEMS_FIELDS,
+                    prettyPrint=False
                 ).execute()
                 
-                video_ids = [item['id']['videoId'] for item in search_response.get('items', [])]
+                video_ids = [item['contentDetails']['videoId'] for item in page_response.get('items', [])]
                 
                 if not video_ids:
                     break
                 
-                # Step 2: Get full video details including status
-                videos_response = service.videos().list(
-                    part='snippet,status',
-                    id=','.join(video_ids),
-                    maxResults=50
-                ).execute()
+                # Step 2: Get full video details including status, in the
+                # background while the next page is fetched
+                detail_pages.append(_details_pool.submit(self._list_videos, video_ids))
+                requested += len(video_ids)
                 
-                items = videos_response.get('items', [])
-                if not items:
+                next_page_token = page_response.get('nextPageToken')
+                if not next_page_token:
                     break
-                
-                for video in items:
+            
+            all_videos = []
+            for detail_page in detail_pages:
+                for video in detail_page.result():
                     snippet = video.get('snippet', {})
                     status = video.get('status', {})
                     
@@ -121,15 +256,9 @@ class YouTubeClient:
                     privacy_status = status.get('privacyStatus', '')
                     upload_status = status.get('uploadStatus', '')
                     
-                    if upload_status == 'uploaded':
-                        if privacy_status == 'public':
-                            video_status = 'published'
-                        elif privacy_status in ['private', 'unlisted'] and publish_at:
-                            video_status = 'scheduled'
-                        else:
-                            video_status = 'private'
-                    else:
-                        video_status = upload_status
+                    video_status = _VIDEO_STATUS_MAP.get((upload_status, privacy_status, bool(publish_at)))
+                    if video_status is None:
+                        video_status = 'private' if upload_status == 'uploaded' else upload_status
                     
                     all_videos.append({
                         'video_id': video['id'],
@@ -143,13 +272,9 @@ class YouTubeClient:
                         'thumbnail': snippet.get('thumbnails', {}).get('default', {}).get('url', ''),
                         'source': 'youtube'
                     })
-                
-                next_page_token = search_response.get('nextPageToken')
-                if not next_page_token:
-                    break
             
             # Sort by date (most recent first) and limit
-            all_videos.sort(key=lambda x: x.get('date', ''), reverse=True)
+            all_videos.sort(key=itemgetter('date'), reverse=True)
             return all_videos[:max_results]
         except HttpError as e:
             raise Exception(f"YouTube API error: {e}")
@@ -159,94 +284,87 @@ class YouTubeClient:
         Get all scheduled videos from YouTube channel.
         
         According to YouTube Data API v3:
-        - Use search.list with forMine=True to get video IDs (requires OAuth 2.0)
+        - List video IDs from the channel's uploads playlist with playlistItems.list
+          (1 quota unit per page, where search.list costs 100)
         - Then use videos.list with those IDs to get status and snippet
         - Filter by status.privacyStatus == "private" and status.publishAt exists
         - publishAt only exists for scheduled videos
+        
+        Scheduled videos are recent uploads, so paging stops after a page with
+        no scheduled videos that reaches uploads older than SCHEDULED_SCAN_WINDOW.
         """
         service = self._get_service()
         try:
+            uploads_playlist_id = self._get_uploads_playlist_id()
+            scan_cutoff = (datetime.now(timezone.utc) - SCHEDULED_SCAN_WINDOW).strftime('%Y-%m-%dT%H:%M:%SZ')
             scheduled_videos = []
+            previous_page = None
             next_page_token = None
             
             while True:
-                # Step 1: Use search.list to get video IDs for authenticated user
-                search_response = service.search().list(
-                    part='id',
-                    forMine=True,
-                    type='video',
+                # Step 1: Get video IDs from the uploads playlist (newest uploads first)
+                page_response = service.playlistItems().list(
+                    part='contentDetails',
+                    playlistId=uploads_playlist_id,
                     maxResults=50,
-                    pageToken=next_page_token
+                    pageToken=next_page_token,
+                    fields=_PLAYLIST_ITEMS_FIELDS,
+                    prettyPrint=False
                 ).execute()
                 
-                video_ids = [item['id']['videoId'] for item in search_response.get('items', [])]
+                video_ids = [item['contentDetails']['videoId'] for item in page_response.get('items', [])]
                 
                 if not video_ids:
                     break
                 
-                # Step 2: Get full video details including status
-                videos_response = service.videos().list(
-                    part='snippet,status',
-                    id=','.join(video_ids),
-                    maxResults=50
-                ).execute()
+                # Step 2: Get full video details including status, in the
+                # background while the next page is fetched
+                detail_page = _details_pool.submit(self._list_videos, video_ids)
                 
-                items = videos_response.get('items', [])
-                if not items:
-                    break
+                # The previous page's details have loaded meanwhile; stop paging
+                # once it shows the scan has reached old, unscheduled uploads
+                keep_scanning = previous_page is None or _collect_scheduled(previous_page.result(), scheduled_videos, scan_cutoff)
+                previous_page = detail_page
                 
-                for video in items:
-                    status = video.get('status', {})
-                    privacy_status = status.get('privacyStatus', '')
-                    publish_at = status.get('publishAt')
-                    
-                    # Scheduled videos are identified by:
-                    # 1. privacyStatus == "private" (or "unlisted")
-                    # 2. publishAt field exists (only present for scheduled videos)
-                    if privacy_status in ['private', 'unlisted'] and publish_at:
-                        # This is a scheduled video
-                        scheduled_videos.append({
-                            'video_id': video['id'],
-                            'title': video['snippet']['title'],
-                            'description': video['snippet'].get('description', ''),
-                            'privacy_status': privacy_status,
-                            'publish_at': publish_at,
-                            'thumbnail': video['snippet'].get('thumbnails', {}).get('default', {}).get('url', '')
-                        })
-                
-                next_page_token = search_response.get('nextPageToken')
-                if not next_page_token:
+                next_page_token = page_response.get('nextPageToken')
+                if not keep_scanning or not next_page_token:
                     break
             
+            if previous_page is not None:
+                _collect_scheduled(previous_page.result(), scheduled_videos, scan_cutoff)
+            
             return scheduled_videos
         except HttpError as e:
             raise Exception(f"YouTube API error: {e}")
     
     def upload_video(
         self,
-        video_path: str,
-        title: str,
-        description: str,
-        tags: List[str],
-        category_id: str,
-        made_for_kids: bool,
+        video_path: Optional[str] = None,
+        title: str = "",
+        description: str = "",
+        tags: Optional[List[str]] = None,
+        category_id: str = "22",
+        made_for_kids: bool = False,
         privacy_status: str = "private",
-        publish_at: Optional[datetime] = None
+        publish_at: Optional[datetime] = None,
+        video_media: Optional[MediaUpload] = None
     ) -> Dict[str, Any]:
         """
         Upload video to YouTube with optional scheduling.
         
+        The video comes either from a local file (video_path) or from any
+        resumable MediaUpload (video_media), e.g. a Drive file streamed with
+        DriveDownloader.stream_file.
+        
         If publish_at is provided, the video will be scheduled to publish at that time.
         The publishAt must be set in the status object during upload (not after).
         """
-        import os
-        from googleapiclient.http import MediaFileUpload
-        
         service = self._get_service()
         
-        # Check if file exists
-        if not os.path.exists(video_path):
-            raise FileNotFoundError(f"Video file not found: {video_path}")
+        if video_media is None:
+            # Check if file exists
+            if not video_path or not os.path.exists(video_path):
+                raise FileNotFoundError(f"Video file not found: {video_path}")
         
         # Build status object
         status_obj = {
@@ -255,15 +373,9 @@ class YouTubeClient:
         }
         
         # Add publishAt if scheduling is requested
-        # Match working code pattern: publish_at_utc.isoformat()
         if publish_at:
-            # Convert to UTC if timezone-aware, otherwise assume UTC
-            if publish_at.tzinfo is None:
-                # If naive datetime, assume it's already in UTC
-                publish_at_utc = publish_at.replace(tzinfo=timezone.utc)
-            else:
-                # Convert to UTC
-                publish_at_utc = publish_at.astimezone(timezone.utc)
+            # Convert to UTC if timezone-aware; a naive datetime is assumed to be UTC already
+            publish_at_utc = publish_at.astimezone(timezone.utc) if publish_at.tzinfo else publish_at.replace(tzinfo=timezone.utc)
             
             # Check if publish time is in the future
             now_utc = datetime.now(timezone.utc)
@@ -273,48 +385,46 @@ class YouTubeClient:
                     f"Provided: {publish_at_utc}, Current: {now_utc}"
                 )
             
-            # Match working code pattern exactly: publish_at_utc.isoformat()
-            # But YouTube API requires Z suffix, not +00:00
-            # Remove timezone info for clean ISO format, then add Z
-            publish_at_naive_utc = publish_at_utc.replace(tzinfo=None)
-            iso_str = publish_at_naive_utc.isoformat() + 'Z'
-            
-            status_obj['publishAt'] = iso_str
-            print(f"[SCHEDULING] Setting publishAt: {status_obj['publishAt']}")
-            print(f"[SCHEDULING] Original: {publish_at} -> UTC: {publish_at_utc} -> Naive UTC: {publish_at_naive_utc}")
-            print(f"[SCHEDULING] Current UTC: {now_utc}, Time until publish: {publish_at_utc - now_utc}")
-            print(f"[SCHEDULING] Full status object: {status_obj}")
+            # YouTube API requires the Z suffix, not +00:00 (see _publish_at)
+            status_obj['publishAt'] = _publish_at(publish_at_utc)
+            logger.debug("[SCHEDULING] Setting publishAt: %s", status_obj['publishAt'])
+            logger.debug("[SCHEDULING] Original: %s -> UTC: %s", publish_at, publish_at_utc)
+            logger.debug("[SCHEDULING] Current UTC: %s, Time until publish: %s", now_utc, publish_at_utc - now_utc)
+            logger.debug("[SCHEDULING] Full status object: %s", status_obj)
         
         body = {
             'snippet': {
                 'title': title,
                 'description': description,
-                'tags': tags,
+                'tags': tags or [],
                 'categoryId': category_id
             },
             'status': status_obj
         }
         
         try:
-            # Create MediaFileUpload object
-            media = MediaFileUpload(
+            # Create MediaFileUpload object unless a media source was given
+            media = video_media or MediaFileUpload(
                 video_path,
-                chunksize=-1,
+                chunksize=UPLOAD_CHUNK_SIZE,
                 resumable=True,
                 mimetype='video/*'
             )
             
             insert_request = service.videos().insert(
-                part=','.join(body.keys()),
+                part=_UPLOAD_PARTS,
                 body=body,
                 media_body=media
             )
             
             response = None
+            logged_step = -1
             while response is None:
                 status, response = insert_request.next_chunk()
-                if status:
-                    print(f"Upload progress: {int(status.progress() * 100)}%")
+                # Log progress once per 5% step, not once per chunk
+                if status and int(status.progress() * 20) != logged_step:
+                    logged_step = int(status.progress() * 20)
+                    logger.debug("Upload progress: %d%%", status.progress() * 100)
             
             # Log response to verify scheduling was set correctly
             response_status = response.get('status', {})
@@ -322,17 +432,20 @@ class YouTubeClient:
             response_privacy = response_status.get('privacyStatus')
             response_upload_status = response_status.get('uploadStatus', 'unknown')
             
-            print(f"[UPLOAD RESULT] Video ID: {response['id']}")
-            print(f"[UPLOAD RESULT] Upload Status: {response_upload_status}")
-            print(f"[UPLOAD RESULT] Privacy Status: {response_privacy}")
-            print(f"[UPLOAD RESULT] Publish At: {response_publish_at if response_publish_at else 'NOT SET - Video will be public immediately!'}")
+            logger.debug(
+                "[UPLOAD RESULT] Video ID: %s, Upload Status: %s, Privacy Status: %s, Publish At: %s",
+                response['id'],
+                response_upload_status,
+                response_privacy,
+                response_publish_at or 'NOT SET - Video will be public immediately!'
+            )
             
             if publish_at and not response_publish_at:
-                print("[ERROR] publishAt was set in request but NOT in response! Video may be public immediately.")
-                print(f"[DEBUG] Request body status: {body.get('status')}")
-                print(f"[DEBUG] Full response status: {response_status}")
+                logger.error("publishAt was set in request but NOT in response! Video %s may be public immediately.", response['id'])
+                logger.debug("Request body status: %s", body.get('status'))
+                logger.debug("Full response status: %s", response_status)
             elif response_publish_at:
-                print(f"[SUCCESS] Video is scheduled to publish at: {response_publish_at}")
+                logger.info("Video %s is scheduled to publish at: %s", response['id'], response_publish_at)
             
             return {
                 "video_id": response['id'],
@@ -346,9 +459,6 @@ class YouTubeClient:
     
     def upload_thumbnail(self, video_id: str, thumbnail_path: str):
         """Upload thumbnail for a video"""
-        import os
-        from googleapiclient.http import MediaFileUpload
-        
         service = self._get_service()
         
         # Check if file exists
@@ -371,24 +481,58 @@ class YouTubeClient:
     
     def get_video_status(self, video_id: str) -> Dict[str, Any]:
         """Get current video status from YouTube"""
+        return self.get_videos_status([video_id]).get(video_id)
+    
+    def get_videos_status(self, video_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get current status for many videos at once.
+        
+        videos.list accepts up to 50 IDs per call, so N videos cost N/50
+        calls (and quota units) instead of N, sent together as one batch
+        request. Videos that YouTube no longer returns are missing from the
+        result.
+        """
         service = self._get_service()
-        try:
-            response = service.videos().list(
+        video_ids = list(dict.fromkeys(video_ids))
+        list_requests = [
+            service.videos().list(
                 part='status,snippet',
-                id=video_id
-            ).execute()
-            
-            if not response.get('items'):
-                return None
+                id=','.join(video_ids[i:i + 50]),
+                maxResults=50,
+                fields=_VIDEO_STATUS_FIELDS,
+                prettyPrint=False
+            )
+            for i in range(0, len(video_ids), 50)
+        ]
+        responses = []
+        
+        def collect(request_id, response, exception):
+            if exception is not None:
+                raise exception
+            responses.append(response)
+        
+        statuses = {}
+        try:
+            if len(list_requests) == 1:
+                responses.append(list_requests[0].execute())
+            else:
+                # Send the chunks as one multipart HTTP request instead of one round trip each
+                for i in range(0, len(list_requests), _BATCH_LIMIT):
+                    batch = service.new_batch_http_request()
+                    for list_request in list_requests[i:i + _BATCH_LIMIT]:
+                        batch.add(list_request, callback=collect)
+                    batch.execute()
             
-            video = response['items'][0]
-            return {
-                'video_id': video_id,
-                'privacy_status': video['status']['privacyStatus'],
-                'publish_at': video['status'].get('publishAt'),
-                'title': video['snippet']['title'],
-                'description': video['snippet']['description']
-            }
+            for response in responses:
+                for video in response.get('items', []):
+                    statuses[video['id']] = {
+                        'video_id': video['id'],
+                        'privacy_status': video['status']['privacyStatus'],
+                        'publish_at': video['status'].get('publishAt'),
+                        'title': video['snippet']['title'],
+                        'description': video['snippet'].get('description', '')
+                    }
+            return statuses
         except HttpError as e:
             raise Exception(f"YouTube API error: {e}")
     
@@ -410,21 +554,85 @@ class YouTubeClient:
     
     def schedule_video_publish(self, video_id: str, publish_datetime: datetime):
         """Schedule a video to be published at a specific datetime using YouTube's scheduling"""
+        errors = self.bulk_schedule([(video_id, publish_datetime)])
+        if errors:
+            raise Exception(errors[video_id])
+    
+    def bulk_schedule(self, schedules: List[Tuple[str, datetime]]) -> Dict[str, str]:
+        """
+        Schedule many videos, each given as (video_id, publish_datetime).
+        
+        More than one update is sent as batch requests of up to 50 calls
+        instead of one round trip per video. Naive datetimes are taken as
+        UTC. Returns error messages by video_id for the updates that failed.
+        """
         service = self._get_service()
-        try:
-            # Format datetime for YouTube API (RFC 3339 format)
-            publish_at = publish_datetime.strftime('%Y-%m-%dT%H:%M:%S.000Z')
-            
-            service.videos().update(
+        # One update per video; the last datetime given for a video wins
+        update_requests = {
+            video_id: service.videos().update(
                 part='status',
                 body={
                     'id': video_id,
                     'status': {
                         'privacyStatus': 'private',
-                        'publishAt': publish_at,
+                        'publishAt': _publish_at(publish_datetime),
                         'selfDeclaredMadeForKids': False
                     }
-                }
-            ).execute()
-        except HttpError as e:
-            raise Exception(f"Schedule publish error: {e}")
\ No newline at end of file
+                },
+                fields='id',
+                prettyPrint=False
+            )
+            for video_id, publish_datetime in schedules
+        }
+        errors = {}
+        
+        def collect(video_id, response, exception):
+            if exception is not None:
+                errors[video_id] = f"Schedule publish error: {exception}"
+        
+        if len(update_requests) == 1:
+            video_id, update_request = next(iter(update_requests.items()))
+            try:
+                update_request.execute()
+            except Exception as e:
+                collect(video_id, None, e)
+        else:
+            video_ids = list(update_requests)
+            for i in range(0, len(video_ids), _BATCH_LIMIT):
+                chunk = video_ids[i:i + _BATCH_LIMIT]
+                answered = set()
+                
+                def collect_chunk(video_id, response, exception):
+                    answered.add(video_id)
+                    collect(video_id, response, exception)
+                
+                batch = service.new_batch_http_request(callback=collect_chunk)
+                for video_id in chunk:
+                    batch.add(update_requests[video_id], request_id=video_id)
+                try:
+                    batch.execute()
+                except Exception as e:
+                    # The batch itself failed (transport error or non-2xx
+                    # envelope); keep the results of earlier chunks
+                    for video_id in chunk:
+                        if video_id not in answered:
+                            collect(video_id, None, e)
+        
+        return errors
+
+
+# Clients shared across requests, keyed by (user_id, channel_id). Entries
+# expire with the access token lifetime so credentials are reloaded hourly.
+_client_cache = TTLCache(maxsize=1024, ttl=3600)
+_client_cache_lock = threading.Lock()
+
+
+def get_or_create_client(user_id: str, channel_id: str) -> YouTubeClient:
+    """Shared YouTubeClient for a channel, rebuilt when its stored token changes"""
+    token_data = storage_manager.get_token(user_id, channel_id)
+    key = (user_id, channel_id)
+    with _client_cache_lock:
+        client = _client_cache.get(key)
+        if client is None or (client.token_data is not None and client.token_data != token_data):
+            client = _client_cache[key] = YouTubeClient(user_id, channel_id)
+    return client
@@ -1,9 +1,14 @@
 from google_auth_oauthlib.flow import Flow
 from google.oauth2.credentials import Credentials
-from google.auth.transport.requests import Request
+from google.auth import _helpers
+from cachetools import TTLCache
 from app.config.settings import settings
-from typing import Optional, Dict, Any
-import json
+from app.http.pool import auth_request
+from app.storage.storage_manager import storage_manager
+from typing import Optional, Dict, Any, Tuple
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+import threading
 
 
 SCOPES = [
@@ -12,21 +17,40 @@ SCOPES = [
     'https://www.googleapis.com/auth/drive.readonly'
 ]
 
+# Cached credentials are reused only while they stay valid at least this long
+CREDENTIALS_MIN_REMAINING = timedelta(seconds=120)
 
-def get_oauth_flow() -> Flow:
-    """Create OAuth flow for YouTube authorization"""
-    client_config = {
+# (user_id, channel_id) -> (stored token data, credentials built from it),
+# shared by the YouTube and Drive clients of a channel. Bounded, since the
+# OAuth callback loads credentials under a throwaway channel key each time.
+_credentials_cache = TTLCache(maxsize=1024, ttl=3600)
+# One lock per channel, so a slow refresh only holds up that channel. An
+# evicted lock at worst lets two threads refresh the same token once.
+_credentials_locks = TTLCache(maxsize=1024, ttl=3600)
+# Guards both caches above; held only around their lookups and updates
+_credentials_cache_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _client_config(redirect_uri: str) -> Dict[str, Any]:
+    """OAuth client configuration (shared, do not mutate)"""
+    return {
         "web": {
             "client_id": settings.google_client_id,
             "client_secret": settings.google_client_secret,
             "auth_uri": "https://accounts.google.com/o/oauth2/auth",
             "token_uri": "https://oauth2.googleapis.com/token",
-            "redirect_uris": [settings.oauth_redirect_uri]
+            "redirect_uris": [redirect_uri]
         }
     }
-    
+
+
+def get_oauth_flow() -> Flow:
+    """Create OAuth flow for YouTube authorization"""
+    # A Flow keeps the state and fetched token of one authorization, so
+    # only its configuration is shared between requests
     flow = Flow.from_client_config(
-        client_config,
+        _client_config(settings.oauth_redirect_uri),
         scopes=SCOPES,
         redirect_uri=settings.oauth_redirect_uri
     )
@@ -64,6 +88,16 @@ def exchange_code_for_token(code: str) -> Dict[str, Any]:
     }
 
 
+def _parse_expiry(expiry: Optional[str]) -> Optional[datetime]:
+    """Stored expiry as the naive UTC datetime google-auth expects"""
+    if not expiry:
+        return None
+    parsed = datetime.fromisoformat(expiry)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
 def get_credentials_from_token(token_data: Dict[str, Any]) -> Credentials:
     """Create Credentials object from stored token data"""
     return Credentials(
@@ -72,12 +106,69 @@ def get_credentials_from_token(token_data: Dict[str, Any]) -> Credentials:
         token_uri=token_data.get("token_uri", "https://oauth2.googleapis.com/token"),
         client_id=token_data.get("client_id", settings.google_client_id),
         client_secret=token_data.get("client_secret", settings.google_client_secret),
-        scopes=token_data.get("scopes", SCOPES)
+        scopes=token_data.get("scopes", SCOPES),
+        expiry=_parse_expiry(token_data.get("expiry"))
     )
 
 
 def refresh_credentials(credentials: Credentials) -> Credentials:
     """Refresh expired credentials"""
     if credentials.expired and credentials.refresh_token:
-        credentials.refresh(Request())
+        credentials.refresh(auth_request())
     return credentials
+
+
+def _still_valid(credentials: Credentials) -> bool:
+    """Whether credentials stay valid for at least CREDENTIALS_MIN_REMAINING"""
+    return (
+        credentials.expiry is not None
+        # Naive UTC, as google-auth stores expiry
+        and credentials.expiry - _helpers.utcnow() > CREDENTIALS_MIN_REMAINING
+    )
+
+
+def get_cached_credentials(user_id: str, channel_id: str) -> Tuple[Credentials, Dict[str, Any]]:
+    """
+    Valid credentials for a channel, with the stored token data they match.
+    
+    Credentials are reused across clients until shortly before they expire
+    and only then refreshed, with the new token saved to storage.
+    """
+    cache_key = (user_id, channel_id)
+    with _credentials_cache_lock:
+        channel_lock = _credentials_locks.get(cache_key)
+        if channel_lock is None:
+            channel_lock = _credentials_locks[cache_key] = threading.Lock()
+    
+    with channel_lock:
+        token_data = storage_manager.get_token(user_id, channel_id)
+        if not token_data:
+            raise ValueError("No token found for this channel")
+        
+        with _credentials_cache_lock:
+            cached = _credentials_cache.get(cache_key)
+        # A reconnected channel stores a new token, which replaces the cached one
+        if cached is not None and cached[0] == token_data and _still_valid(cached[1]):
+            return cached[1], cached[0]
+        
+        credentials = get_credentials_from_token(token_data)
+        if not _still_valid(credentials) and credentials.refresh_token:
+            credentials.refresh(auth_request())
+            
+            token_data = {
+                "access_token": credentials.token,
+                "refresh_token": credentials.refresh_token,
+                "token_uri": credentials.token_uri,
+                "client_id": credentials.client_id,
+                "client_secret": credentials.client_secret,
+                "scopes": credentials.scopes,
+                "expiry": credentials.expiry.isoformat() if credentials.expiry else None,
+                "channel_id": channel_id,
+                "channel_name": token_data.get("channel_name", ""),
+                "created_at": token_data.get("created_at") or datetime.now(timezone.utc).isoformat()
+            }
+            storage_manager.save_token(user_id, channel_id, token_data)
+        
+        with _credentials_cache_lock:
+            _credentials_cache[cache_key] = (token_data, credentials)
+        return credentials, token_data
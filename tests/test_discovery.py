@@ -0,0 +1,30 @@
+import json
+import unittest
+
+from app.http.discovery import OrjsonModel
+
+
+class OrjsonModelTest(unittest.TestCase):
+    
+    def test_serialize_non_ascii_title_is_ascii(self):
+        body = {'snippet': {'title': 'café 日本語 🎬'}}
+        
+        serialized = OrjsonModel(False).serialize(body)
+        
+        # httplib2 encodes str bodies as Latin-1 and sizes them by len()
+        self.assertEqual(len(serialized.encode('latin-1')), len(serialized))
+        self.assertEqual(json.loads(serialized), body)
+    
+    def test_serialize_wraps_data(self):
+        serialized = OrjsonModel(True).serialize({'title': 'café'})
+        
+        self.assertEqual(json.loads(serialized), {'data': {'title': 'café'}})
+    
+    def test_deserialize_non_ascii(self):
+        content = json.dumps({'title': 'café 🎬'}, ensure_ascii=False).encode('utf-8')
+        
+        self.assertEqual(OrjsonModel(False).deserialize(content), {'title': 'café 🎬'})
+
+
+if __name__ == '__main__':
+    unittest.main()
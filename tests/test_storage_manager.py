@@ -0,0 +1,73 @@
+import gc
+import os
+import tempfile
+import unittest
+import weakref
+from unittest import mock
+
+from app.config.settings import settings
+from app.storage import storage_manager as storage_module
+
+
+class _Parsed(dict):
+    """Weak-referenceable stand-in for a parsed JSON file"""
+
+
+class StorageManagerTest(unittest.TestCase):
+    
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        paths = {
+            name: os.path.join(tmp.name, os.path.relpath(getattr(settings, name), 'storage'))
+            for name in [
+                'users_file', 'recent_videos_file', 'jobs_dir', 'tokens_dir', 'failed_videos_dir',
+                'tokens_file', 'jobs_file', 'failed_videos_file'
+            ]
+        }
+        paths['storage_dir'] = tmp.name
+        for name, path in paths.items():
+            patcher = mock.patch.object(settings, name, path)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.storage = storage_module.StorageManager()
+    
+    def test_record_memo_releases_old_parses(self):
+        parses = []
+        loads = storage_module.orjson.loads
+        
+        def tracked_loads(content):
+            parsed = _Parsed(loads(content))
+            parses.append(weakref.ref(parsed))
+            return parsed
+        
+        with mock.patch.object(storage_module, 'orjson', mock.Mock(wraps=storage_module.orjson, loads=tracked_loads)):
+            for i in range(50):
+                self.storage.save_user(f"user{i}", {'email': f"user{i}@example.com"})
+                self.assertEqual(self.storage.get_user(f"user{i}")['email'], f"user{i}@example.com")
+        
+        gc.collect()
+        # Only the latest parse, held by the file cache, stays alive
+        self.assertLessEqual(sum(ref() is not None for ref in parses), 1)
+    
+    def test_record_memo_sees_writes(self):
+        self.storage.save_user('user1', {'email': 'old@example.com'})
+        self.assertEqual(self.storage.get_user('user1')['email'], 'old@example.com')
+        
+        self.storage.save_user('user1', {'email': 'new@example.com'})
+        
+        self.assertEqual(self.storage.get_user('user1')['email'], 'new@example.com')
+    
+    def test_user_jobs_signature_changes_on_job_writes(self):
+        self.assertIsNone(self.storage.get_user_jobs_signature('user1'))
+        self.storage.save_job('job1', {'user_id': 'user1', 'status': 'scheduled'})
+        before = self.storage.get_user_jobs_signature('user1')
+        
+        self.storage.bulk_update_job_status('user1', [('job1', 'published', None)])
+        
+        self.assertIsNotNone(before)
+        self.assertNotEqual(self.storage.get_user_jobs_signature('user1'), before)
+
+
+if __name__ == '__main__':
+    unittest.main()